@@ -1,32 +1,93 @@
 import os
-import shutil
-import subprocess
+import hashlib
+import threading
 import logging
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from collections import deque
+from functools import lru_cache
+from pathlib import PurePath
+from concurrent.futures import ThreadPoolExecutor, wait
+import jinja2
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, Template
 import json
-import traceback
-import sys
 
 # Import parsers and specific generators
 from parsers.openapi_parser import OpenAPISpec
 from parsers.mapping_parser import MappingSpec
-print("DEBUG: Imported parsers in engine.py") # DEBUG
 
 # Import generator modules (will be created later)
 from generator.meta_generator import prepare_meta_context
 from generator.schema_generator import prepare_schema_context
 from generator.pom_generator import prepare_pom_context
 from generator.java_generator import generate_all_java_files
-print("DEBUG: Imported sub-generators in engine.py") # DEBUG
+from generator.source_signature import source_signature
 
 log = logging.getLogger(__name__)
 
+# Template locations are fixed relative to this module, so resolve them once at import time
+_TEMPLATE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'templates'))
+_TEMPLATE_CACHE_DIR = os.path.join(_TEMPLATE_DIR, '.jinja_cache')
+
+# Write buffer for generated files; large enough that most outputs hit disk in a single write()
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Per-output-directory records of generated file hashes, used to skip rewriting unchanged files.
+# They live in the user's cache directory, not in the generated project that gets committed and shipped.
+CODEGEN_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'dataconnectors_codegen', 'outputs'
+)
+# Where earlier versions kept the record, inside the output directory; removed when found
+LEGACY_CODEGEN_CACHE_FILENAME = '.codegen-cache.json'
+
+# Number of trailing Maven output lines repeated in the failure summary
+MAVEN_ERROR_TAIL_LINES = 50
+
+# Only markup outputs (pom.xml, schema.orx) need escaping; Java sources and JSON must be emitted verbatim
+AUTOESCAPE_TEMPLATE_SUFFIXES = ('xml.j2', 'html.j2', 'orx.j2')
+
+# Jinja's bytecode cache is keyed on template source only, so bytecode compiled under different
+# Environment options (e.g. autoescape) would be reused. Bump this whenever those options change.
+TEMPLATE_CACHE_VERSION = 3
+
+def _autoescape_template(template_name: str | None) -> bool:
+    """Jinja autoescape predicate: escape markup templates only."""
+    return template_name is not None and template_name.endswith(AUTOESCAPE_TEMPLATE_SUFFIXES)
+
+@lru_cache(maxsize=None)
+def _generator_signature() -> str:
+    """Signature of every generator source and template, plus the Jinja version and cache version.
+
+    Any change to the code that builds render contexts, the Environment options, filters or
+    templates (including ones pulled in via include/import) must invalidate skipped renders.
+    """
+    key = f"jinja2:{jinja2.__version__}\0template_cache:{TEMPLATE_CACHE_VERSION}\0{source_signature()}"
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+
+@lru_cache(maxsize=None)
+def _shared_jinja_env() -> Environment:
+    """Builds the Jinja2 environment once per process.
+
+    Engines created for later entries of a batch run reuse it, and with it the templates
+    it has already loaded and compiled, instead of reloading them from the bytecode cache.
+    """
+    # Persist compiled template bytecode so repeated runs skip parsing/compiling the .j2 sources
+    os.makedirs(_TEMPLATE_CACHE_DIR, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(_TEMPLATE_DIR),
+        autoescape=_autoescape_template,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True, # Emit templates' final newline as-is instead of stripping it
+        bytecode_cache=FileSystemBytecodeCache(_TEMPLATE_CACHE_DIR, pattern=f'__jinja2_v{TEMPLATE_CACHE_VERSION}_%s.cache'),
+        auto_reload=False # Templates are static for the lifetime of the process
+    )
+
 class GeneratorEngine:
     """Orchestrates the data connector generation process."""
 
-    def __init__(self, openapi_spec: OpenAPISpec, mapping_spec: MappingSpec, output_dir: str, package_name: str, sdk_version: str, java_version: str, schema_extraction: bool, okhttp_version: str, jackson_version: str):
-        print("DEBUG: Entered GeneratorEngine.__init__")
-        
+    def __init__(self, openapi_spec: OpenAPISpec, mapping_spec: MappingSpec, output_dir: str, package_name: str, sdk_version: str, java_version: str, schema_extraction: bool, okhttp_version: str, jackson_version: str, pretty_json: bool = False):
+        log.debug("Entered GeneratorEngine.__init__")
+
         self.openapi_spec = openapi_spec
         self.mapping_spec = mapping_spec
         self.output_dir = output_dir
@@ -36,16 +97,32 @@ class GeneratorEngine:
         self.generate_schema_extraction = schema_extraction
         self.okhttp_version = okhttp_version
         self.jackson_version = jackson_version
-        self.package_path = package_name.replace('.', '/')
-
-        # Configure Jinja2 environment
-        self.template_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'templates'))
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(self.template_dir),
-            autoescape=select_autoescape(enabled_extensions=('html', 'xml', 'j2'), default_for_string=True),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        # Indent JSON resources for readability; by default they are written compact
+        self.pretty_json = pretty_json
+        # Package name variants, computed once and shared with the Java generator
+        self.package_dots = package_name
+        self.package_slash = package_name.replace('.', '/')
+        self.package_path = self.package_slash
+        self.package_client = f"{package_name}.client"
+        self.package_model = f"{package_name}.model"
+        self.package_converter = f"{package_name}.converter"
+        self.subpackages = {'client': self.package_client, 'converter': self.package_converter, 'model': self.package_model}
+
+        # Configure Jinja2 environment (shared by every engine in the process)
+        self.template_dir = _TEMPLATE_DIR
+        self.template_cache_dir = _TEMPLATE_CACHE_DIR
+        self.jinja_env = _shared_jinja_env()
+        # Memoized get_template() results, keyed by template name
+        self._tmpl_cache: dict[str, Template] = {}
+        # Dispatch table of precompiled Java templates, filled before Java generation
+        self._java_templates: dict[str, Template] = {}
+        # Prepared template contexts, computed lazily on first use
+        self._pom_ctx = self._meta_ctx = self._schema_ctx = None
+        # Content hashes of generated files, used to skip rewriting unchanged outputs
+        self._output_hashes: dict[str, dict] = {}
+        self._output_hashes_lock = threading.Lock()
+        # Absolute path to the Maven launcher, resolved on first build
+        self._mvn = None
 
         # Define output paths within the generated project
         self.base_output_path = os.path.abspath(output_dir)
@@ -53,176 +130,366 @@ class GeneratorEngine:
         self.src_main_resources_path = os.path.join(self.base_output_path, 'src', 'main', 'resources')
         self.meta_inf_connector_path = os.path.join(self.src_main_resources_path, 'META-INF', 'connector')
         self.java_package_path = os.path.join(self.src_main_java_path, self.package_path)
+        # One hash record per output directory, named after its absolute path
+        output_id = hashlib.blake2b(self.base_output_path.encode('utf-8'), digest_size=16).hexdigest()
+        self.codegen_cache_path = os.path.join(CODEGEN_CACHE_DIR, f"{output_id}.json")
+        # Component package directories, joined once and shared with the Java generator
+        self.java_package_pp = PurePath(self.java_package_path)
+        self.paths = {component: self.java_package_pp / component for component in ('client', 'converter', 'model')}
 
 
     def _create_output_dirs(self):
         """Creates the necessary Maven directory structure."""
         os.makedirs(self.java_package_path, exist_ok=True)
-        # Directories for specific code components (client, converter, model)
-        os.makedirs(os.path.join(self.java_package_path, 'client'), exist_ok=True)
-        os.makedirs(os.path.join(self.java_package_path, 'converter'), exist_ok=True)
-        os.makedirs(os.path.join(self.java_package_path, 'model'), exist_ok=True)
+        # Directories for specific code components (client, converter, model).
+        # Their parent exists now, so a plain mkdir is enough - no need to re-walk the whole path.
+        for component_path in self.paths.values():
+            try:
+                os.mkdir(component_path)
+            except FileExistsError:
+                pass
 
         os.makedirs(self.meta_inf_connector_path, exist_ok=True)
         print(f"Created directory structure under: {self.base_output_path}")
 
-    def _render_template(self, template_name: str, context: dict, output_path: str):
-        """Renders a Jinja2 template and writes it to the output path."""
-        print(f"DEBUG: Attempting to render template '{template_name}' to '{output_path}'")
-        
+    def _precompile_java_templates(self):
+        """Compiles every Java template once so per-file renders skip the Jinja loader."""
+        java_template_dir = os.path.join(self.template_dir, 'java')
+        with os.scandir(java_template_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith('.j2'):
+                    template_name = f"java/{entry.name}"
+                    self._java_templates[template_name] = self.jinja_env.get_template(template_name)
+
+    def _render_template(self, template_name: str, context: dict, output_path: str | PurePath, input_key: str | None = None):
+        """Renders a Jinja2 template and writes it to the output path.
+
+        input_key, when given, identifies everything the context was built from. If the previous
+        run wrote this file from the same key and template, and the file is untouched since,
+        rendering is skipped altogether.
+        """
+        log.debug("Attempting to render template '%s' to '%s'", template_name, output_path)
+
         try:
-            template = self.jinja_env.get_template(template_name)
-            rendered_content = template.render(context)
-            
-            if not rendered_content.strip():
+            template = self._java_templates.get(template_name) or self._tmpl_cache.get(template_name)
+            if template is None:
+                template = self._tmpl_cache.setdefault(template_name, self.jinja_env.get_template(template_name))
+
+            output_key = os.fspath(output_path)
+            input_digest = None
+            if input_key is not None:
+                input_digest = self._input_digest(template, input_key)
+                if self._is_input_unchanged(output_key, input_digest):
+                    log.debug("Inputs unchanged, not re-rendering: %s", output_path)
+                    return
+
+            # Render in buffered chunks, hashing as we go so an unchanged file need not be rewritten
+            stream = template.stream(context)
+            stream.enable_buffering(size=64)
+
+            # Encode once here and write the bytes as-is, skipping the text layer's newline translation
+            chunks = []
+            hasher = hashlib.blake2b(digest_size=16)
+            has_content = False
+            for chunk in stream:
+                if not has_content and chunk.strip():
+                    has_content = True
+                data = chunk.encode('utf-8')
+                chunks.append(data)
+                hasher.update(data)
+
+            if not has_content:
                  print(f"WARNING: Template {template_name} rendered empty content!")
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(rendered_content)
-            print(f"Generated: {output_path}")
+
+            self._write_output(output_path, chunks, hasher.hexdigest(), input_digest)
         except Exception as e:
-             print(f"ERROR rendering template {template_name} or writing to {output_path}: {e}")
-             traceback.print_exc()
-             # Explicitly exit with error code
-             sys.exit(1)
+            log.error("Render failed for %s -> %s: %s", template_name, output_path, e)
+            raise
 
-    def generate_all(self):
-        """Runs all generation steps."""
-        self._create_output_dirs()
+    def _write_output(self, output_path: str | PurePath, chunks: list[bytes], digest: str, input_digest: str | None = None):
+        """Writes an encoded output file, unless the file on disk already holds exactly this content."""
+        output_key = os.fspath(output_path)
+        if self._is_output_unchanged(output_key, digest):
+            log.debug("Unchanged, not rewriting: %s", output_path)
+            if input_digest is not None:
+                with self._output_hashes_lock:
+                    self._output_hashes[output_key]['input'] = input_digest
+            return
+
+        with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.writelines(chunks)
+        self._record_output_hash(output_key, digest, input_digest)
+        print(f"Generated: {output_path}") # User-facing progress, shown without --verbose
+
+    def _load_output_hashes(self):
+        """Loads the content hashes recorded by the previous run into this output directory."""
+        try:
+            # Drop the record an earlier version left in the generated project (it holds host paths)
+            os.remove(os.path.join(self.base_output_path, LEGACY_CODEGEN_CACHE_FILENAME))
+        except FileNotFoundError:
+            pass
+        try:
+            with open(self.codegen_cache_path, 'r', encoding='utf-8') as f:
+                self._output_hashes = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._output_hashes = {}
+
+    def _save_output_hashes(self):
+        """Persists the content hashes of the generated files for the next run."""
+        # json.dumps (unlike json.dump) serializes with the C encoder; the file is only read back by us
+        data = json.dumps(self._output_hashes, separators=(',', ':'))
+        try:
+            os.makedirs(CODEGEN_CACHE_DIR, exist_ok=True)
+            with open(self.codegen_cache_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+        except OSError as e:
+            # Only costs the next run its skipped writes; the generated project itself is complete
+            log.warning("Could not save generated file hashes to %s: %s", self.codegen_cache_path, e)
+
+    def _is_output_unchanged(self, output_key: str, digest: str) -> bool:
+        """True if the file on disk is exactly what a previous run wrote for the same content hash."""
+        entry = self._output_hashes.get(output_key)
+        if entry is None or entry['hash'] != digest:
+            return False
+        return self._is_file_as_recorded(output_key, entry)
+
+    @staticmethod
+    def _is_file_as_recorded(output_key: str, entry: dict) -> bool:
+        """True if the file still has the size and mtime recorded when we wrote it."""
+        # Size + mtime guard against the file having been edited or replaced since we wrote it
+        try:
+            st = os.stat(output_key)
+        except FileNotFoundError:
+            return False
+        return st.st_size == entry['size'] and st.st_mtime_ns == entry['mtime_ns']
 
-        print("\nGenerating pom.xml...")
-        self._generate_pom_xml()
+    def _record_output_hash(self, output_key: str, digest: str, input_digest: str | None = None):
+        """Remembers the hash and stat signature of a freshly written file."""
+        st = os.stat(output_key)
+        entry = {'hash': digest, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+        if input_digest is not None:
+            entry['input'] = input_digest
+        with self._output_hashes_lock:
+            self._output_hashes[output_key] = entry
 
-        print("\nGenerating meta.json...")
-        self._generate_meta_json()
+    def _input_digest(self, template: Template, input_key: str) -> str:
+        """Hashes a caller's input key together with the template name and the generator signature."""
+        # Editing a template or any generator module must invalidate every output rendered before
+        key = f"{_generator_signature()}\0{template.name}\0{input_key}"
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
 
-        print("\nGenerating schema definition...")
-        self._generate_schema()
+    def _is_input_unchanged(self, output_key: str, input_digest: str) -> bool:
+        """True if the file on disk was rendered by a previous run from the same inputs and is untouched."""
+        entry = self._output_hashes.get(output_key)
+        if entry is None or entry.get('input') != input_digest:
+            return False
+        return self._is_file_as_recorded(output_key, entry)
 
-        print("\nGenerating Java source code...")
-        self._generate_java_code()
+    def generate_all(self):
+        """Runs all generation steps."""
+        self._create_output_dirs()
+        self._load_output_hashes()
+        # Compile the Java templates before fanning out so worker threads only read the dispatch table
+        if not self._java_templates:
+            self._precompile_java_templates()
 
-        print("\nWriting mapping config resource...")
-        self._write_mapping_config()
+        # The phases write disjoint files and only read the parsed specs, so run them concurrently
+        phases = (
+            ("Generating pom.xml...", self._generate_pom_xml),
+            ("Generating meta.json...", self._generate_meta_json),
+            ("Generating schema definition...", self._generate_schema),
+            ("Writing mapping config resource...", self._write_mapping_config),
+        )
+        try:
+            # One pool for the whole run, shared by these phases and the Java file renders
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = [executor.submit(self._run_phase, message, phase) for message, phase in phases]
+                # Java generation runs in this thread and only queues renders, so no pool thread waits on another
+                self._run_phase("Generating Java source code...", self._generate_java_code, executor)
+                wait(futures)
+            # Re-raise the first failure in the calling thread
+            for future in futures:
+                future.result()
+        finally:
+            # Hashes are recorded per written file, so they are valid even after a partial run
+            self._save_output_hashes()
 
         # TODO: Copy any static resources if needed
 
+    @staticmethod
+    def _run_phase(message: str, phase, *args):
+        """Runs one generation phase, announcing it when it actually starts and naming it if it fails."""
+        # Single write, so concurrently starting phases don't interleave the header and its newline
+        print(f"\n{message}\n", end='')
+        try:
+            phase(*args)
+        except Exception as e:
+            print(f"  Failed: {message.rstrip('.')}: {e}")
+            raise
+
     def _generate_pom_xml(self):
         """Generates the pom.xml file."""
         try:
-            context = prepare_pom_context(
-                self.openapi_spec,
-                self.mapping_spec,
-                self.package_name,
-                self.sdk_version,
-                self.java_version,
-                self.okhttp_version,
-                self.jackson_version
-            )
-            output_file_path = os.path.join(self.base_output_path, 'pom.xml')
-            self._render_template('resources/pom.xml.j2', context, output_file_path)
+            if self._pom_ctx is None:
+                self._pom_ctx = prepare_pom_context(
+                    self.openapi_spec,
+                    self.mapping_spec,
+                    self.package_name,
+                    self.sdk_version,
+                    self.java_version,
+                    self.okhttp_version,
+                    self.jackson_version
+                )
         except Exception as e:
             print(f"  Error generating pom.xml: {e}")
             # Optionally re-raise or handle more gracefully
+            return
+        output_file_path = os.path.join(self.base_output_path, 'pom.xml')
+        # Render/write failures propagate to the caller
+        self._render_template('resources/pom.xml.j2', self._pom_ctx, output_file_path)
 
     def _generate_meta_json(self):
         """Generates the meta.json file."""
         try:
-            context = prepare_meta_context(
-                self.openapi_spec,
-                generate_schema_extraction=self.generate_schema_extraction
-            )
-            output_file_path = os.path.join(self.meta_inf_connector_path, 'meta.json')
-            self._render_template('resources/meta.json.j2', context, output_file_path)
+            if self._meta_ctx is None:
+                self._meta_ctx = prepare_meta_context(
+                    self.openapi_spec,
+                    generate_schema_extraction=self.generate_schema_extraction
+                )
         except Exception as e:
             print(f"  Error generating meta.json: {e}")
             # Optionally re-raise or handle more gracefully
+            return
+        output_file_path = os.path.join(self.meta_inf_connector_path, 'meta.json')
+        # Render/write failures propagate to the caller
+        self._render_template('resources/meta.json.j2', self._meta_ctx, output_file_path)
 
     def _generate_schema(self):
         """Generates the schema definition file (.orx)."""
         try:
-            context = prepare_schema_context(self.openapi_spec, self.mapping_spec)
-            output_file_path = os.path.join(self.meta_inf_connector_path, 'schema.orx')
-            self._render_template('resources/schema.orx.j2', context, output_file_path)
+            if self._schema_ctx is None:
+                self._schema_ctx = prepare_schema_context(self.openapi_spec, self.mapping_spec)
         except Exception as e:
             print(f"  Error generating schema.orx: {e}")
             # Optionally re-raise or handle more gracefully
+            return
+        output_file_path = os.path.join(self.meta_inf_connector_path, 'schema.orx')
+        # Render/write failures propagate to the caller
+        self._render_template('resources/schema.orx.j2', self._schema_ctx, output_file_path)
+
+    def _generate_java_code(self, executor: ThreadPoolExecutor):
+        """Generates all necessary Java source files, rendering them on the given pool."""
+        log.debug("Entering _generate_java_code")
+
+        if not self._java_templates:
+            self._precompile_java_templates()
+
+        # Each Java file is independent, so the render callback only queues the work;
+        # the files are rendered and written in parallel by the pool.
+        render_futures = []
+
+        def submit_render(template_name: str, context: dict, output_path: str | PurePath, input_key: str | None = None):
+            render_futures.append(executor.submit(self._render_template, template_name, context, output_path, input_key))
 
-    def _generate_java_code(self):
-        """Generates all necessary Java source files."""
-        print("DEBUG: Entering _generate_java_code")
-        
         generate_all_java_files(
             openapi_spec=self.openapi_spec,
             mapping_spec=self.mapping_spec,
             package_name=self.package_name,
             java_package_base_path=self.java_package_path,
-            render_template=self._render_template,
+            render_template=submit_render,
+            component_paths=self.paths,
+            subpackages=self.subpackages,
             schema_extraction_enabled=self.generate_schema_extraction
         )
-        
-        print("DEBUG: Exiting _generate_java_code normally")
+        wait(render_futures)
+        for future in render_futures:
+            future.result()
+
+        log.debug("Exiting _generate_java_code normally")
 
     def _write_mapping_config(self):
         """Writes the mapping specification data to a JSON file in resources."""
         output_file_path = os.path.join(self.src_main_resources_path, 'mapping_config.json')
         try:
-            with open(output_file_path, 'w', encoding='utf-8') as f:
-                # The mapping_spec object holds the raw data dictionary
-                json.dump(self.mapping_spec.data, f, indent=2, ensure_ascii=False)
-            print(f"Generated: {output_file_path}")
+            # The mapping_spec object holds the raw data dictionary. The connector only reads it back,
+            # so it is compact unless asked otherwise: json.dumps without indent runs in the C encoder.
+            if self.pretty_json:
+                text = json.dumps(self.mapping_spec.data, indent=2, ensure_ascii=False)
+            else:
+                text = json.dumps(self.mapping_spec.data, ensure_ascii=False, separators=(',', ':'))
+            data = text.encode('utf-8')
+            self._write_output(output_file_path, [data], hashlib.blake2b(data, digest_size=16).hexdigest())
         except Exception as e:
             print(f"  Error writing mapping_config.json: {e}")
 
     def build_connector(self):
         """(Optional) Attempts to build the generated connector using Maven."""
+        # Only needed for the optional build step, so keep them off the generate-only import path
+        import shutil
+        import subprocess
+
         log.info("Attempting to build connector JAR using Maven...")
         pom_path = os.path.join(self.base_output_path, 'pom.xml')
-        if not os.path.exists(pom_path):
-            log.error("Cannot build: pom.xml not found at {}", pom_path)
+        try:
+            os.stat(pom_path)
+        except FileNotFoundError:
+            log.error("Cannot build: pom.xml not found at %s", pom_path)
+            return False
+
+        # Resolve the Maven launcher once. On Windows this is mvn.cmd, which we invoke
+        # directly instead of going through cmd.exe via shell=True.
+        if self._mvn is None:
+            self._mvn = shutil.which('mvn.cmd') if os.name == 'nt' else shutil.which('mvn')
+        if self._mvn is None:
+            log.error("Maven command ('mvn') not found. Is Maven installed and in your system PATH?")
+            print("Error: 'mvn' command not found. Please ensure Apache Maven is installed and configured in your PATH.")
             return False
 
         # Simple command execution
         # TODO: Make Maven path configurable? Add error checking based on return code.
-        command = ["mvn", "clean", "package", "-f", pom_path]
+        command = [self._mvn, "clean", "package", "-f", pom_path]
         log.info(f"Executing Maven command: {' '.join(command)} in {self.base_output_path}")
 
         try:
-            # Use shell=True on Windows if mvn is in PATH but not found directly?
-            # Or ensure mvn.cmd is used.
-            # Using shell=False is generally safer if mvn is directly executable.
-            process = subprocess.run(
+            # Forward Maven's output line by line as it is produced instead of buffering the whole
+            # build log; only the last few lines are kept for the failure summary.
+            output_tail = deque(maxlen=MAVEN_ERROR_TAIL_LINES)
+            print("\n--- Maven Build Output ---")
+            with subprocess.Popen(
                 command,
                 cwd=self.base_output_path,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT, # Interleave stderr with stdout, as Maven users expect
                 text=True,
-                check=False, # Check manually based on returncode
-                shell=True if os.name == 'nt' else False # Use shell=True on Windows for mvn.cmd
-            )
+                bufsize=1, # Line buffered
+                shell=False
+            ) as process:
+                for line in process.stdout:
+                    print(line, end='')
+                    output_tail.append(line)
+                returncode = process.wait()
+            print("--------------------------")
 
-            if process.returncode == 0:
+            if returncode == 0:
                 log.info("Maven build successful.")
-                print("\n--- Maven Build Output ---")
-                print(process.stdout)
-                print("--------------------------")
                 # TODO: Try to find the generated JAR path based on pom artifactId/version
                 # final_name = ... # Extract from pom or shade plugin config
                 # jar_path = os.path.join(self.base_output_path, 'target', f"{final_name}.jar")
                 print(f"Connector JAR should be located in: {os.path.join(self.base_output_path, 'target')}")
                 return True
             else:
-                log.error("Maven build failed! Return code: {}", process.returncode)
-                print("\n--- Maven Build Error Output ---")
-                print(process.stderr)
-                print(process.stdout) # Also print stdout for context
+                log.error("Maven build failed! Return code: %s", returncode)
+                print(f"\n--- Maven Build Error Output (last {len(output_tail)} lines) ---")
+                print(''.join(output_tail), end='')
                 print("------------------------------")
                 return False
 
         except FileNotFoundError:
-            log.error("Maven command ('mvn') not found. Is Maven installed and in your system PATH?")
-            print("Error: 'mvn' command not found. Please ensure Apache Maven is installed and configured in your PATH.")
+            # pom.xml and the launcher were both checked above, so the resolved launcher itself has gone missing
+            log.error("Maven launcher '%s' could not be executed.", self._mvn)
+            print(f"Error: Maven launcher '{self._mvn}' could not be executed. Please check your Maven installation.")
             return False
         except Exception as e:
-            log.error("An unexpected error occurred during Maven build: {}", e)
+            log.error("An unexpected error occurred during Maven build: %s", e)
             print(f"An unexpected error occurred during build: {e}")
             return False 
\ No newline at end of file
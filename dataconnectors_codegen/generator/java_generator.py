@@ -1,12 +1,17 @@
 import os
 import re
-from typing import Dict, Any, List, Set, Callable, Optional
+from pathlib import PurePath
+from typing import Dict, Any, List, Set, Callable, Optional, NamedTuple
 import logging
+from functools import lru_cache
+from itertools import chain
+import heapq
 import json # Add json import for metadata serialization
 
 # Ensure absolute imports are used
 from parsers.openapi_parser import OpenAPISpec
 from parsers.mapping_parser import MappingSpec
+from parsers.json_io import dumps_compact
 from generator.meta_generator import _to_camel_case # Reuse helper
 
 log = logging.getLogger(__name__)
@@ -33,15 +38,127 @@ ADD_REQUEST_CLASS = f"{SDK_PACKAGE}.request.AddRequest"
 MODIFY_REQUEST_CLASS = f"{SDK_PACKAGE}.request.ModifyRequest"
 DELETE_REQUEST_CLASS = f"{SDK_PACKAGE}.request.DeleteRequest"
 
+DN_CLASS = f"{SDK_PACKAGE}.dn.DN"
+FILTER_CLASS = f"{SDK_PACKAGE}.filter.Filter"
+FILTER_TYPE_ENUM = f"{SDK_PACKAGE}.filter.FilterType"
+FILTER_VISITOR_INTERFACE = f"{SDK_PACKAGE}.filter.FilterVisitor"
+
 RESPONSE_ENTITY_CLASS = f"{SDK_PACKAGE}.response.ResponseEntity"
 SEARCH_RESULT_ENTRY_CLASS = f"{SDK_PACKAGE}.response.SearchResultEntry"
 RESPONSE_STATUS_ENUM = f"{SDK_PACKAGE}.response.ResponseStatus"
+# Simple (unqualified) names of the response types, as used in generated code
+RESPONSE_ENTITY_SIMPLE = RESPONSE_ENTITY_CLASS.rpartition('.')[2]
+SEARCH_RESULT_ENTRY_SIMPLE = SEARCH_RESULT_ENTRY_CLASS.rpartition('.')[2]
+RESPONSE_STATUS_SIMPLE = RESPONSE_STATUS_ENUM.rpartition('.')[2]
 
 CONVERTER_INTERFACE = f"{SDK_PACKAGE}.converter.TypeConverter"
 
 # Assumed names for generated backend request/response base types
 BACKEND_REQUEST_BASE = "BackendRequest"
 BACKEND_RESPONSE_BASE = "BackendResponse"
+# Imports every generated Backend Client needs (the model package wildcard is added per package)
+_CLIENT_BASE_IMPORTS = frozenset({
+    MANAGED_COMPONENT_ANNOTATION,
+    INJECT_ANNOTATION,
+    PROPERTIES_ANNOTATION,
+    INJECTABLE_PROPS_ENUM,
+    RESPONSE_ENTITY_CLASS,
+    RESPONSE_STATUS_ENUM,
+    "java.io.IOException",
+    "java.util.List",
+    "java.util.Map",
+    "java.util.Objects",
+    "java.util.concurrent.TimeUnit",
+    "java.util.concurrent.atomic.AtomicReference", # For potential OAuth
+    "javax.annotation.PostConstruct",
+    "okhttp3.*",
+    "org.slf4j.Logger",
+    "org.slf4j.LoggerFactory",
+    "com.fasterxml.jackson.databind.ObjectMapper",
+    "com.fasterxml.jackson.datatype.jsr310.JavaTimeModule"
+})
+# Imports every generated request converter needs (model package wildcard added per package)
+_REQ_CONVERTER_BASE_IMPORTS = frozenset({
+    MANAGED_COMPONENT_ANNOTATION,
+    CONVERTER_INTERFACE,
+    DN_CLASS,
+    FILTER_CLASS,
+    FILTER_TYPE_ENUM,
+    FILTER_VISITOR_INTERFACE,
+    LDAP_REQUEST_CLASS,
+    SEARCH_REQUEST_CLASS,
+    ADD_REQUEST_CLASS,
+    MODIFY_REQUEST_CLASS,
+    DELETE_REQUEST_CLASS,
+    "java.util.ArrayList",
+    "java.util.Collections",
+    "java.util.HashMap",
+    "java.util.List",
+    "java.util.Map",
+    "java.util.Set",
+    "javax.naming.NamingException",
+    "javax.naming.directory.Attribute",
+    "javax.naming.directory.Attributes",
+    "javax.naming.directory.ModificationItem",
+    "javax.naming.directory.DirContext", # For modification op constants
+    "org.slf4j.Logger",
+    "org.slf4j.LoggerFactory",
+    "com.fasterxml.jackson.databind.ObjectMapper", # For mapping load and POJO mapping
+    # For reflection in mapAttributesToPojo
+    "java.lang.reflect.Method",
+    "java.lang.reflect.InvocationTargetException",
+    "java.math.BigDecimal", # For number conversions
+    "java.time.LocalDate",
+    "java.time.OffsetDateTime",
+    "java.time.format.DateTimeParseException"
+})
+# Imports every generated response converter needs (model package wildcard added per package)
+_RESP_CONVERTER_BASE_IMPORTS = frozenset({
+    MANAGED_COMPONENT_ANNOTATION,
+    CONVERTER_INTERFACE,
+    DN_CLASS,
+    RESPONSE_ENTITY_CLASS,
+    RESPONSE_STATUS_ENUM,
+    SEARCH_RESULT_ENTRY_CLASS,
+    "java.lang.reflect.Method",
+    "java.util.ArrayList",
+    "java.util.Collection",
+    "java.util.Collections",
+    "java.util.List",
+    "java.util.Map",
+    "java.util.Optional",
+    "javax.naming.NamingException",
+    "javax.naming.directory.Attribute",
+    "javax.naming.directory.Attributes",
+    "javax.naming.directory.BasicAttribute",
+    "javax.naming.directory.BasicAttributes",
+    "org.slf4j.Logger",
+    "org.slf4j.LoggerFactory",
+    "com.fasterxml.jackson.databind.ObjectMapper" # For mapping load
+})
+# Imports every generated main Connector needs (model package wildcard added per package)
+_MAIN_CONNECTOR_BASE_IMPORTS = frozenset({
+    MANAGED_COMPONENT_ANNOTATION,
+    CUSTOM_CONNECTOR_ANNOTATION,
+    INJECT_ANNOTATION,
+    RESPONSE_ENTITY_CLASS,
+    RESPONSE_STATUS_ENUM,
+    SEARCH_RESULT_ENTRY_CLASS,
+    "java.io.IOException", # For catching client exceptions
+    "java.util.Collections",
+    "java.util.List",
+    "java.util.Map", # For metadata loading
+    "org.slf4j.Logger",
+    "org.slf4j.LoggerFactory"
+})
+# Presorted views of the constant import sets, merged with the few per-call extras
+_REQ_CONVERTER_BASE_IMPORTS_SORTED = tuple(sorted(_REQ_CONVERTER_BASE_IMPORTS))
+_RESP_CONVERTER_BASE_IMPORTS_SORTED = tuple(sorted(_RESP_CONVERTER_BASE_IMPORTS))
+_MAIN_CONNECTOR_BASE_IMPORTS_SORTED = tuple(sorted(_MAIN_CONNECTOR_BASE_IMPORTS))
+# HTTP methods that become Backend Client operations (other path item keys are skipped)
+_HTTP_METHODS = frozenset({'GET', 'POST', 'PUT', 'PATCH', 'DELETE'})
+# Parameter locations that become Backend Client method arguments
+_SIGNATURE_PARAM_LOCATIONS = ('path', 'query')
 # --- End Java SDK Constants ---
 
 # --- Java Generation Utilities ---
@@ -51,16 +168,23 @@ BACKEND_RESPONSE_BASE = "BackendResponse"
 # Jackson Annotations (Assuming Jackson is the chosen library)
 JACKSON_JSON_PROPERTY_ANNOTATION = "com.fasterxml.jackson.annotation.JsonProperty"
 
+# Identifier normalization patterns, compiled once
+_INVALID_CHARS_RE = re.compile(r'[^a-zA-Z0-9_\s-]+')
+_SEPARATORS_RE = re.compile(r'[_\s-]+')
+
+# Identifier names repeat heavily (same properties across schemas, same params across operations)
+@lru_cache(maxsize=4096)
 def to_java_class_name(name: str) -> str:
     """Converts a name (e.g., from OpenAPI schema) to a Java ClassName."""
     if not name:
         return "UnnamedModel"
     # Remove invalid characters, replace separators with spaces
-    name = re.sub(r'[^a-zA-Z0-9_\s-]+', '', name)
-    name = re.sub(r'[_\s-]+', ' ', name).strip()
+    name = _INVALID_CHARS_RE.sub('', name)
+    name = _SEPARATORS_RE.sub(' ', name).strip()
     # Capitalize words and join
     return "".join(word.capitalize() for word in name.split())
 
+@lru_cache(maxsize=4096)
 def to_java_variable_name(name: str) -> str:
     """Converts a name to a Java variableName (camelCase)."""
     class_name = to_java_class_name(name)
@@ -68,73 +192,181 @@ def to_java_variable_name(name: str) -> str:
         return "unnamedVar"
     return class_name[0].lower() + class_name[1:]
 
-def get_java_type(schema_prop: Dict[str, Any], model_package: Optional[str] = None, imports: Optional[Set[str]] = None) -> str:
+# Java type used for loosely defined inline objects
+_MAP_STRING_OBJECT = "Map<String, Object>"
+
+# String formats that map to something other than String: format -> (import or None, simple type)
+_STRING_FORMAT_TYPES = {
+    'date': ("java.time.LocalDate", "LocalDate"),
+    'date-time': ("java.time.OffsetDateTime", "OffsetDateTime"),
+    'binary': (None, "byte[]"), # No import needed for byte[]
+    'byte': (None, "byte[]"),
+}
+
+def _handle_string(schema_prop: Dict[str, Any], model_package: Optional[str], needed: List[str]) -> str:
+    format_type = _STRING_FORMAT_TYPES.get(schema_prop.get('format'))
+    if format_type is None:
+        # No import needed for String
+        return "String"
+    type_import, java_type = format_type
+    if type_import:
+        needed.append(type_import)
+    return java_type
+
+def _handle_integer(schema_prop: Dict[str, Any], model_package: Optional[str], needed: List[str]) -> str:
+    # No import needed for Long/Integer wrapper types
+    return "Long" if schema_prop.get('format') == 'int64' else "Integer"
+
+def _handle_number(schema_prop: Dict[str, Any], model_package: Optional[str], needed: List[str]) -> str:
+    # No import needed for Float/Double wrapper types
+    return "Float" if schema_prop.get('format') == 'float' else "Double"
+
+def _handle_boolean(schema_prop: Dict[str, Any], model_package: Optional[str], needed: List[str]) -> str:
+    # No import needed for Boolean wrapper type
+    return "Boolean"
+
+def _handle_array(schema_prop: Dict[str, Any], model_package: Optional[str], needed: List[str]) -> str:
+    needed.append("java.util.List")
+    items = schema_prop.get('items', {})
+    # Recursively resolve the item type, collecting into the same import list
+    item_type_name = _resolve_java_type(items, model_package, needed)
+    return f"List<{item_type_name}>"
+
+def _handle_object(schema_prop: Dict[str, Any], model_package: Optional[str], needed: List[str]) -> str:
+    ref = schema_prop.get('$ref')
+    if ref:
+        # It's a reference to another schema (potential POJO)
+        schema_name = ref.split('/')[-1]
+        # Return the simple class name. Caller must handle import based on model_package.
+        java_type = to_java_class_name(schema_name)
+        # Ensure the referenced POJO is imported if it's in the model package
+        if model_package:
+             needed.append(f"{model_package}.{java_type}")
+        return java_type
+    # Could be a map or inline object
+    additional_props = schema_prop.get('additionalProperties')
+    needed.append("java.util.Map")
+    if isinstance(additional_props, dict):
+        # It's a map
+        value_type_name = _resolve_java_type(additional_props, model_package, needed)
+        return f"Map<String, {value_type_name}>"
+    # Inline object without $ref or additionalProperties - less defined
+    # Fallback to Map<String, Object> might be safest
+    return _MAP_STRING_OBJECT
+
+# OpenAPI type -> handler returning the simple Java type name (and collecting needed imports)
+_TYPE_HANDLERS = {
+    'string': _handle_string,
+    'integer': _handle_integer,
+    'number': _handle_number,
+    'boolean': _handle_boolean,
+    'array': _handle_array,
+    'object': _handle_object,
+}
+
+# Types whose Java mapping depends only on (type, format); $ref'd objects depend only on the ref
+_CACHEABLE_TYPES = frozenset({'string', 'integer', 'number', 'boolean'})
+
+# (type, format, $ref, model_package) -> (simple Java type, imports it needs).
+# Cleared at the start of every generate_all_java_files() run.
+_JAVA_TYPE_CACHE: Dict[tuple, tuple[str, tuple[str, ...]]] = {}
+
+def _resolve_java_type(schema_prop: Dict[str, Any], model_package: Optional[str], needed: List[str]) -> str:
+    """Returns the simple Java type name, appending required imports to the `needed` list."""
+    schema_type = schema_prop.get('type', 'object')
+    ref = schema_prop.get('$ref')
+    # Arrays and inline maps depend on nested schemas, so only scalars and refs are memoized.
+    # OpenAPI 3.1 allows a list of types, which is unhashable and never cached.
+    if isinstance(schema_type, str) and (schema_type in _CACHEABLE_TYPES or (ref and schema_type == 'object')):
+        key = (schema_type, schema_prop.get('format'), ref, model_package)
+        cached = _JAVA_TYPE_CACHE.get(key)
+        if cached is None:
+            own_needed: List[str] = []
+            cached = _JAVA_TYPE_CACHE[key] = (_TYPE_HANDLERS[schema_type](schema_prop, model_package, own_needed), tuple(own_needed))
+        needed.extend(cached[1])
+        return cached[0]
+    handler = _TYPE_HANDLERS.get(schema_type) if isinstance(schema_type, str) else None
+    if handler is None:
+        return "Object" # Default fallback for unknown types and OpenAPI 3.1 type lists
+    return handler(schema_prop, model_package, needed)
+
+def get_java_type(schema_prop: Dict[str, Any], model_package: Optional[str], imports: Set[str]) -> str:
     """Maps OpenAPI property type to Java type name (simple name),
        adding necessary fully qualified imports to the passed set.
     """
-    # Ensure imports set exists if provided
-    if imports is None:
-        imports = set() # Work locally if no set provided, though caller should provide one
-
-    openapi_type = schema_prop.get('type', 'object')
-    openapi_format = schema_prop.get('format')
-    java_type = "Object" # Default fallback
-
-    if openapi_type == 'string':
-        if openapi_format == 'date':
-            imports.add("java.time.LocalDate")
-            java_type = "LocalDate"
-        elif openapi_format == 'date-time':
-            imports.add("java.time.OffsetDateTime")
-            java_type = "OffsetDateTime"
-        elif openapi_format == 'binary' or openapi_format == 'byte':
-            # No import needed for byte[]
-            java_type = "byte[]"
-        else:
-            # No import needed for String
-            java_type = "String"
-    elif openapi_type == 'integer':
-        # No import needed for Long/Integer wrapper types
-        java_type = "Long" if openapi_format == 'int64' else "Integer"
-    elif openapi_type == 'number':
-        # No import needed for Float/Double wrapper types
-        java_type = "Float" if openapi_format == 'float' else "Double"
-    elif openapi_type == 'boolean':
-        # No import needed for Boolean wrapper type
-        java_type = "Boolean"
-    elif openapi_type == 'array':
-        imports.add("java.util.List")
-        items = schema_prop.get('items', {})
-        # Recursively get type for items, passing imports set
-        item_type_name = get_java_type(items, model_package, imports)
-        java_type = f"List<{item_type_name}>"
-    elif openapi_type == 'object':
-        ref = schema_prop.get('$ref')
-        if ref:
-            # It's a reference to another schema (potential POJO)
-            schema_name = ref.split('/')[-1]
-            # Return the simple class name. Caller must handle import based on model_package.
-            java_type = to_java_class_name(schema_name)
-            # Ensure the referenced POJO is imported if it's in the model package
-            if model_package:
-                 imports.add(f"{model_package}.{java_type}")
-        else:
-            # Could be a map or inline object
-            additional_props = schema_prop.get('additionalProperties')
-            if isinstance(additional_props, dict):
-                # It's a map
-                imports.add("java.util.Map")
-                value_type_name = get_java_type(additional_props, model_package, imports)
-                java_type = f"Map<String, {value_type_name}>"
-            else:
-                # Inline object without $ref or additionalProperties - less defined
-                # Fallback to Map<String, Object> might be safest
-                imports.add("java.util.Map")
-                java_type = "Map<String, Object>"
-
-    # Return the determined simple Java type name
+    # Collect imports locally and merge them into the caller's set in one go
+    needed: List[str] = []
+    java_type = _resolve_java_type(schema_prop, model_package, needed)
+    if needed:
+        imports.update(needed)
     return java_type
 
+class _JavaField(NamedTuple):
+    """A POJO field as consumed by Pojo.java.j2 (attribute names match the template)."""
+    name: str
+    type: str
+    original_name: str # JSON property name, for @JsonProperty
+    getterName: str
+    setterName: str
+
+def _java_field(name: str, java_type: str, original_name: Optional[str] = None) -> _JavaField:
+    """Builds a POJO field with its getter/setter names; original_name defaults to the field name."""
+    # Upper-case only the first character; str.capitalize() would lower-case the rest (e.g. 'baseURL')
+    cap_name = name[:1].upper() + name[1:]
+    return _JavaField(name, java_type, name if original_name is None else original_name, f"get{cap_name}", f"set{cap_name}")
+
+def _merge_sorted_imports(base_sorted: tuple, base: frozenset, extras: Set[str]) -> tuple:
+    """Returns the sorted union of a presorted constant import set and per-call extra imports."""
+    extras = extras - base
+    if not extras:
+        return base_sorted
+    return tuple(heapq.merge(base_sorted, sorted(extras)))
+
+# --- Base Request/Response POJOs ---
+# Their shape is fixed, so fields and accessors are built once at import time;
+# only the package name varies between runs.
+_BACKEND_REQUEST_CONTEXT = {
+    'class_name': BACKEND_REQUEST_BASE,
+    'imports': ("java.util.List", "java.util.Map", "java.util.Set"),
+    'fields': (
+        # Fields to hold information extracted by the LdapToBackendRequestConverter
+        _java_field('httpMethod', 'String'),
+        _java_field('pathTemplate', 'String'), # Original path template (e.g., /users/{id})
+        _java_field('pathParams', 'Map<String, String>'), # Resolved path parameters
+        _java_field('queryParams', 'Map<String, String>'), # API query parameters
+        _java_field('requestBody', 'Object'), # POJO or structure for request body
+        _java_field('headers', 'Map<String, String>'), # Specific headers if needed
+        _java_field('targetObjectClass', 'String'), # LDAP ObjectClass being processed
+        _java_field('resourceId', 'String'), # Extracted primary key/ID, often for BASE scope
+        _java_field('fieldsToRetrieve', 'List<String>'), # API fields requested (if mapping from LDAP attributes)
+        # _java_field('originalLdapRequest', 'LdapRequest'), # Optionally store original
+
+        # ** NEW FIELD ** for target client method
+        _java_field('targetClientMethodName', 'String'), # Name of the client method to call
+
+        # Old field - deprecate/remove in favor of targetClientMethodName
+        # _java_field('operationHint', 'String') # Hint for which client method (e.g., operationId)
+    ),
+    'constructor_args': (), # Basic constructor
+    'use_lombok_data': False,
+    'use_lombok_constructors': False
+}
+
+_BACKEND_RESPONSE_CONTEXT = {
+    'class_name': BACKEND_RESPONSE_BASE,
+    'imports': ("java.util.List", "java.util.Map"),
+    'fields': (
+        # Fields to hold information extracted from the client's response
+        _java_field('statusCode', 'int'),
+        _java_field('payload', 'Object'), # Deserialized POJO or List<POJO>
+        _java_field('headers', 'Map<String, List<String>>') # Response headers
+        # _java_field('originalBackendRequest', BACKEND_REQUEST_BASE), # Optionally link back
+    ),
+    'constructor_args': (), # Basic constructor
+    'use_lombok_data': False,
+    'use_lombok_constructors': False
+}
+
 # --- End Java Generation Utilities ---
 
 def generate_all_java_files(
@@ -142,8 +374,10 @@ def generate_all_java_files(
     mapping_spec: MappingSpec,
     package_name: str,
     java_package_base_path: str,
-    render_template: Callable[[str, Dict, str], None],
-    schema_extraction_enabled: bool = False # Add flag from CLI
+    render_template: Callable[..., None],
+    schema_extraction_enabled: bool = False, # Add flag from CLI
+    component_paths: Optional[Dict[str, PurePath]] = None,
+    subpackages: Optional[Dict[str, str]] = None
 ):
     """
     Orchestrates the generation of all Java source files.
@@ -153,45 +387,68 @@ def generate_all_java_files(
         mapping_spec: Parsed mapping spec.
         package_name: Base Java package name (e.g., com.example.connector).
         java_package_base_path: Filesystem path to the base package directory.
-        render_template: The rendering function from GeneratorEngine.
+        render_template: The rendering function from GeneratorEngine, called as
+            (template_name, context, output_path[, input_key]).
         schema_extraction_enabled: Flag indicating if schema extraction should be generated.
+        component_paths: Optional precomputed 'client'/'converter'/'model' directories.
+            Derived from java_package_base_path when not given.
+        subpackages: Optional precomputed 'client'/'converter'/'model' package names.
+            Derived from package_name when not given.
     """
-    print("DEBUG: TOP OF generate_all_java_files EXECUTED")
-
     log.info("Starting Java code generation...")
-    print("DEBUG: Entering generate_all_java_files") # Existing DEBUG
+    log.debug("Entering generate_all_java_files")
+
+    # Type mappings are per spec/package; don't carry them over from a previous run
+    _JAVA_TYPE_CACHE.clear()
 
     # Determine necessary operations from OpenAPI spec
-    operations = _determine_operations(openapi_spec, schema_extraction_enabled)
-    print(f"DEBUG: Determined operations: {operations}") # Existing DEBUG
-    model_package = f"{package_name}.model"
+    # (also indexes each path's HTTP methods so the client generator doesn't walk the paths again)
+    operations, path_method_index = _determine_operations(openapi_spec, schema_extraction_enabled)
+    log.debug("Determined operations: %s", operations)
+    if subpackages is None:
+        subpackages = {component: f"{package_name}.{component}" for component in ('client', 'converter', 'model')}
+    if component_paths is None:
+        base = PurePath(java_package_base_path)
+        component_paths = {component: base / component for component in ('client', 'converter', 'model')}
+    # One stat per component directory; GeneratorEngine normally created them already
+    for component_path in component_paths.values():
+        if not os.path.isdir(component_path):
+            os.makedirs(component_path, exist_ok=True)
 
     # --- Generate Model POJOs from OpenAPI Schemas ---
-    generated_models = _generate_model_pojos(openapi_spec, package_name, java_package_base_path, render_template)
+    generated_models = _generate_model_pojos(openapi_spec, subpackages['model'], component_paths['model'], render_template)
 
     # --- Generate Base BackendRequest/Response POJOs ---
-    _generate_base_request_response_pojos(package_name, java_package_base_path, render_template)
+    _generate_base_request_response_pojos(subpackages['model'], component_paths['model'], render_template)
 
     # --- Generate Backend Client --- [STEP 1]
     # This function now needs to return the metadata map
-    client_class_name, client_method_metadata = _generate_backend_client(openapi_spec, mapping_spec, package_name, java_package_base_path, render_template)
-    print(f"DEBUG: _generate_backend_client returned: {client_class_name} with metadata keys: {list(client_method_metadata.keys())}") # Add check
+    client_class_name, client_method_metadata = _generate_backend_client(openapi_spec, mapping_spec, subpackages, component_paths['client'], render_template, path_method_index)
+    log.debug("_generate_backend_client returned: %s with %d metadata entries", client_class_name, len(client_method_metadata))
+    # Serialized once; embedded verbatim by both converters and the connector
+    client_method_metadata_json = dumps_compact(client_method_metadata or {})
 
     # --- Generate Type Converters --- [STEP 2 partial - need to pass metadata]
-    req_converter_class_name, resp_converter_class_name = _generate_type_converters(openapi_spec, mapping_spec, package_name, java_package_base_path, render_template, operations, generated_models, client_method_metadata)
-    print(f"DEBUG: _generate_type_converters returned: Req={req_converter_class_name}, Resp={resp_converter_class_name}") # Add check
+    req_converter_class_name, resp_converter_class_name = _generate_type_converters(openapi_spec, mapping_spec, subpackages, component_paths['converter'], render_template, operations, generated_models, client_method_metadata_json)
+    log.debug("_generate_type_converters returned: Req=%s, Resp=%s", req_converter_class_name, resp_converter_class_name)
 
     # --- Generate Main Connector Class --- [STEP 3]
-    _generate_main_connector(openapi_spec, mapping_spec, package_name, java_package_base_path, render_template, operations, client_class_name, req_converter_class_name, resp_converter_class_name, generated_models, client_method_metadata)
-    print(f"DEBUG: Completed call to _generate_main_connector") # Add check
+    _generate_main_connector(openapi_spec, mapping_spec, package_name, subpackages, java_package_base_path, render_template, operations, client_class_name, req_converter_class_name, resp_converter_class_name, generated_models, client_method_metadata_json)
+    log.debug("Completed call to _generate_main_connector")
 
     log.info("Java code generation finished.")
-    print("DEBUG: Exiting generate_all_java_files normally") # Existing DEBUG
+    log.debug("Exiting generate_all_java_files normally")
+
+def _determine_operations(openapi_spec: OpenAPISpec, schema_extraction_enabled: bool) -> tuple[Set[str], List[tuple]]:
+    """Determines which CRUD operations seem to be supported based on HTTP methods in paths.
 
-def _determine_operations(openapi_spec: OpenAPISpec, schema_extraction_enabled: bool) -> Set[str]:
-    """Determines which CRUD operations seem to be supported based on HTTP methods in paths."""
-    print("DEBUG: Entering _determine_operations")
+    Also returns the path/method index built along the way: one
+    (path_template, common_params, [(http_method, http_method_upper, op_details), ...])
+    entry per path, listing only the HTTP method keys.
+    """
+    log.debug("Entering _determine_operations")
     operations = set()
+    path_method_index = []
     # Always include TestConnect
     operations.add("TestConnect")
 
@@ -199,7 +456,13 @@ def _determine_operations(openapi_spec: OpenAPISpec, schema_extraction_enabled:
         paths = openapi_spec.get_paths()
         for path, path_item in paths.items():
             # Check methods defined directly on the path item
-            methods = {k.upper() for k in path_item.keys() if k.upper() in ['GET', 'POST', 'PUT', 'PATCH', 'DELETE']}
+            path_methods = []
+            for key, op_details in path_item.items():
+                key_upper = key.upper()
+                if key_upper in _HTTP_METHODS:
+                    path_methods.append((key, key_upper, op_details))
+            path_method_index.append((path, path_item.get('parameters', []), path_methods))
+            methods = {key_upper for _, key_upper, _ in path_methods}
             # TODO: Also consider methods defined under path_item.get('operations', {}) if structure differs
 
             if 'GET' in methods:
@@ -210,11 +473,8 @@ def _determine_operations(openapi_spec: OpenAPISpec, schema_extraction_enabled:
                 operations.add("Modification")
             if 'DELETE' in methods:
                 operations.add("Deletion")
-    except Exception as e:
-        print(f"ERROR inside _determine_operations: {e}")
-        import traceback
-        traceback.print_exc()
-        # Optionally re-raise
+    except Exception:
+        log.exception("Error inside _determine_operations")
         raise
 
     # Add SchemaExtraction if enabled via CLI flag
@@ -223,25 +483,29 @@ def _determine_operations(openapi_spec: OpenAPISpec, schema_extraction_enabled:
          log.info("Schema extraction operation enabled by flag.")
 
     log.info(f"Detected potential operations: {operations}")
-    print(f"DEBUG: Exiting _determine_operations, found: {operations}") # DEBUG
-    return operations
+    return operations, path_method_index
+
+def _pojo_input_key(model_package: str, schema_name: str, schema_details: Dict[str, Any]) -> str:
+    """Canonical description of everything a model POJO is generated from.
 
-def _generate_model_pojos(openapi_spec: OpenAPISpec, package_name: str, base_path: str, render: Callable) -> Set[str]:
+    Lets the render callback skip POJOs whose schema is unchanged since the last run.
+    The engine folds in the signature of the generator sources and templates.
+    """
+    schema_json = json.dumps(schema_details, sort_keys=True, separators=(',', ':'), default=str)
+    return f"{model_package}\0{schema_name}\0{schema_json}"
+
+def _generate_model_pojos(openapi_spec: OpenAPISpec, model_package: str, model_path: PurePath, render: Callable) -> Set[str]:
     """Generates Java POJO classes from OpenAPI schemas. Returns names of generated classes."""
     log.info("  Generating Model POJOs...")
-    print("DEBUG: Entering _generate_model_pojos") # DEBUG
-    model_path = os.path.join(base_path, 'model')
-    os.makedirs(model_path, exist_ok=True)
-    model_package = f"{package_name}.model"
+    log.debug("Entering _generate_model_pojos")
     generated_models = set()
 
     schemas = openapi_spec.get_schemas()
     if not schemas:
         log.warning("  No schemas found in OpenAPI spec to generate POJOs.")
-        print("DEBUG: No schemas found in OpenAPI spec.") # DEBUG
         return generated_models
 
-    print(f"DEBUG: Found {len(schemas)} schemas in OpenAPI spec: {list(schemas.keys())}") # DEBUG
+    log.debug("Found %d schemas in OpenAPI spec", len(schemas))
 
     for schema_name, schema_details in schemas.items():
         # Generate POJO only for object types (or refs treated as objects)
@@ -265,15 +529,8 @@ def _generate_model_pojos(openapi_spec: OpenAPISpec, package_name: str, base_pat
                 field_name = to_java_variable_name(prop_name)
                 # Get Java type and update imports set
                 java_type_simple = get_java_type(prop_details, model_package, imports)
-                field = {
-                    'name': field_name,
-                    'type': java_type_simple,
-                    'json_property': prop_name,
-                    'getter': f"get{field_name.capitalize()}",
-                    'setter': f"set{field_name.capitalize()}"
-                    # TODO: Add description, required status, constraints if needed
-                }
-                fields.append(field)
+                # TODO: Add description, required status, constraints if needed
+                fields.append(_java_field(field_name, java_type_simple, prop_name))
 
             # Determine constructor args (e.g., for required fields)
             # TODO: Implement logic for required fields if needed for constructors
@@ -282,7 +539,7 @@ def _generate_model_pojos(openapi_spec: OpenAPISpec, package_name: str, base_pat
             context = {
                 'package_name': model_package,
                 'class_name': class_name,
-                'imports': sorted(list(imports)),
+                'imports': tuple(sorted(imports)),
                 'fields': fields,
                 'constructor_args': constructor_args,
                 # Add flags for lombok if used
@@ -290,193 +547,104 @@ def _generate_model_pojos(openapi_spec: OpenAPISpec, package_name: str, base_pat
                 'use_lombok_constructors': False
             }
 
-            output_file = os.path.join(model_path, f"{class_name}.java")
-            render('java/Pojo.java.j2', context, output_file)
+            output_file = model_path / f"{class_name}.java"
+            render('java/Pojo.java.j2', context, output_file, _pojo_input_key(model_package, schema_name, schema_details))
         else:
             log.debug(f"  Skipping POJO generation for schema '{schema_name}' as its type is '{schema_type}'.")
 
-    print(f"DEBUG: Generated model POJO names: {generated_models}") # DEBUG
+    log.debug("Generated model POJO names: %s", generated_models)
     return generated_models
 
-def _generate_base_request_response_pojos(package_name: str, base_path: str, render: Callable):
+def _generate_base_request_response_pojos(model_package: str, model_path: PurePath, render: Callable):
     """Generates the BackendRequest and BackendResponse POJOs."""
     log.info("  Generating Base Request/Response POJOs...")
-    print("DEBUG: Entering _generate_base_request_response_pojos") # DEBUG
-    model_path = os.path.join(base_path, 'model')
-    model_package = f"{package_name}.model"
+    log.debug("Entering _generate_base_request_response_pojos")
 
     # --- Generate BackendRequest --- [STEP 2 partial]
-    request_imports = set([
-        "java.util.Map",
-        "java.util.List",
-        "java.util.Set"
-    ])
-    request_fields = [
-        # Fields to hold information extracted by the LdapToBackendRequestConverter
-        {'name': 'httpMethod', 'type': 'String'},
-        {'name': 'pathTemplate', 'type': 'String'}, # Original path template (e.g., /users/{id})
-        {'name': 'pathParams', 'type': 'Map<String, String>'}, # Resolved path parameters
-        {'name': 'queryParams', 'type': 'Map<String, String>'}, # API query parameters
-        {'name': 'requestBody', 'type': 'Object'}, # POJO or structure for request body
-        {'name': 'headers', 'type': 'Map<String, String>'}, # Specific headers if needed
-        {'name': 'targetObjectClass', 'type': 'String'}, # LDAP ObjectClass being processed
-        {'name': 'resourceId', 'type': 'String'}, # Extracted primary key/ID, often for BASE scope
-        {'name': 'fieldsToRetrieve', 'type': 'List<String>'}, # API fields requested (if mapping from LDAP attributes)
-        # {'name': 'originalLdapRequest', 'type': 'LdapRequest'}, # Optionally store original
-
-        # ** NEW FIELD ** for target client method
-        {'name': 'targetClientMethodName', 'type': 'String'}, # Name of the client method to call
-
-        # Old field - deprecate/remove in favor of targetClientMethodName
-        # {'name': 'operationHint', 'type': 'String'} # Hint for which client method (e.g., operationId)
-    ]
-    # Add imports for field types
-    request_imports.add("java.util.Map")
-    request_imports.add("java.util.List")
-    request_imports.add("java.util.Set")
-
-    # Add getter/setter info
-    for field in request_fields:
-        cap_name = field['name'][0].upper() + field['name'][1:]
-        field['getterName'] = f"get{cap_name}"
-        field['setterName'] = f"set{cap_name}"
-        field['original_name'] = field['name']
-
-    request_context = {
-        'package_name': model_package,
-        'class_name': BACKEND_REQUEST_BASE,
-        'imports': sorted(list(request_imports)),
-        'fields': request_fields,
-        'constructor_args': [], # Basic constructor
-        'use_lombok_data': False,
-        'use_lombok_constructors': False
-    }
-    output_file_req = os.path.join(model_path, f"{BACKEND_REQUEST_BASE}.java")
+    request_context = dict(_BACKEND_REQUEST_CONTEXT, package_name=model_package)
+    output_file_req = model_path / f"{BACKEND_REQUEST_BASE}.java"
     render('java/Pojo.java.j2', request_context, output_file_req)
 
     # --- Generate BackendResponse ---
-    response_imports = set([
-        "java.util.Map",
-        "java.util.List"
-    ])
-    response_fields = [
-        # Fields to hold information extracted from the client's response
-        {'name': 'statusCode', 'type': 'int'},
-        {'name': 'payload', 'type': 'Object'}, # Deserialized POJO or List<POJO>
-        {'name': 'headers', 'type': 'Map<String, List<String>>'} # Response headers
-        # {'name': 'originalBackendRequest', 'type': BACKEND_REQUEST_BASE}, # Optionally link back
-    ]
-    # Add imports for field types
-    response_imports.add("java.util.Map")
-    response_imports.add("java.util.List")
-
-    # Add getter/setter info
-    for field in response_fields:
-        cap_name = field['name'][0].upper() + field['name'][1:]
-        field['getterName'] = f"get{cap_name}"
-        field['setterName'] = f"set{cap_name}"
-        field['original_name'] = field['name']
-
-    response_context = {
-        'package_name': model_package,
-        'class_name': BACKEND_RESPONSE_BASE,
-        'imports': sorted(list(response_imports)),
-        'fields': response_fields,
-        'constructor_args': [], # Basic constructor
-        'use_lombok_data': False,
-        'use_lombok_constructors': False
-    }
-    output_file_resp = os.path.join(model_path, f"{BACKEND_RESPONSE_BASE}.java")
+    response_context = dict(_BACKEND_RESPONSE_CONTEXT, package_name=model_package)
+    output_file_resp = model_path / f"{BACKEND_RESPONSE_BASE}.java"
     render('java/Pojo.java.j2', response_context, output_file_resp)
 
-    print(f"DEBUG: Generated {BACKEND_REQUEST_BASE}.java and {BACKEND_RESPONSE_BASE}.java")
+    log.debug("Queued %s.java and %s.java", BACKEND_REQUEST_BASE, BACKEND_RESPONSE_BASE)
+
+# Path template -> operationId suffix: separators become '_', closing braces are dropped
+_PATH_ID_TRANS = str.maketrans({'/': '_', '{': '_', '}': None})
+
+# Cached per path, so a path shared by several methods is translated once
+@lru_cache(maxsize=4096)
+def _path_id_suffix(path_template: str) -> str:
+    return path_template.translate(_PATH_ID_TRANS)
+
+def _synth_operation_id(http_method: str, path_template: str) -> str:
+    """Builds a fallback operationId such as 'get_users__id' for operations that lack one."""
+    return f"{http_method.lower()}{_path_id_suffix(path_template)}"
+
+def _build_client_param(param_details: Dict[str, Any], model_package: str, imports: Set[str]) -> Dict[str, Any]:
+    """Builds the client method parameter for a path/query parameter, adding its type's imports."""
+    param_name = param_details.get('name')
+    return {
+        'name': to_java_variable_name(param_name),
+        'type': get_java_type(param_details.get('schema', {}), model_package, imports),
+        'original_name': param_name,
+        'in': param_details.get('in'),
+        'description': param_details.get('description', '')
+    }
 
 def _generate_backend_client(
     openapi_spec: OpenAPISpec,
     mapping_spec: MappingSpec,
-    package_name: str,
-    base_path: str,
-    render: Callable
+    subpackages: Dict[str, str],
+    client_path: PurePath,
+    render: Callable,
+    path_method_index: List[tuple]
 ) -> tuple[str, dict]: # Return client class name and method metadata
     """Generates the Backend HTTP Client class. Returns class name and method metadata map."""
     log.info("  Generating Backend Client...")
-    print("DEBUG: Entering _generate_backend_client") # DEBUG
-    client_path = os.path.join(base_path, 'client')
-    os.makedirs(client_path, exist_ok=True)
-    client_package = f"{package_name}.client"
-    model_package = f"{package_name}.model"
+    log.debug("Entering _generate_backend_client")
+    client_package = subpackages['client']
+    model_package = subpackages['model']
 
     # Use API title or a default for class name
-    api_title = openapi_spec.data.get('info', {}).get('title', 'GenericApi')
+    api_title = openapi_spec.info.get('title', 'GenericApi')
     class_name = f"{to_java_class_name(api_title)}Client"
 
-    imports = set([
-        f"{model_package}.*", # Import all models
-        MANAGED_COMPONENT_ANNOTATION,
-        INJECT_ANNOTATION,
-        PROPERTIES_ANNOTATION,
-        INJECTABLE_PROPS_ENUM,
-        RESPONSE_ENTITY_CLASS,
-        RESPONSE_STATUS_ENUM,
-        "java.io.IOException",
-        "java.util.List",
-        "java.util.Map",
-        "java.util.Objects",
-        "java.util.concurrent.TimeUnit",
-        "java.util.concurrent.atomic.AtomicReference", # For potential OAuth
-        "javax.annotation.PostConstruct",
-        "okhttp3.*",
-        "org.slf4j.Logger",
-        "org.slf4j.LoggerFactory",
-        "com.fasterxml.jackson.databind.ObjectMapper",
-        "com.fasterxml.jackson.datatype.jsr310.JavaTimeModule"
-    ])
+    imports = set(_CLIENT_BASE_IMPORTS)
+    imports.add(f"{model_package}.*") # Import all models
+    uses_backend_response = False # Whether any method returns the BackendResponse wrapper
 
     # Process paths to create methods
     methods = []
     client_method_metadata = {} # [STEP 1] Initialize metadata map
+    # testConnection candidates, tracked while methods are built
+    first_paramless_get = None
+    first_any_get = None
 
-    paths = openapi_spec.get_paths()
     schemas = openapi_spec.get_schemas() # Need this to resolve response types
 
-    for path_template, path_details in paths.items():
-        common_params = path_details.get('parameters', [])
-
-        for http_method, op_details in path_details.items():
-            if http_method.upper() not in ['GET', 'POST', 'PUT', 'PATCH', 'DELETE']:
-                continue # Skip non-method keys like 'parameters'
-
+    # Paths were already walked by _determine_operations; non-method keys are filtered out
+    for path_template, common_params, path_methods in path_method_index:
+        for http_method, http_method_upper, op_details in path_methods:
             operation_id = op_details.get('operationId')
             if not operation_id:
                 # Generate an ID if missing (less ideal)
-                operation_id = f"{http_method.lower()}{path_template.replace('/', '_').replace('{', '_').replace('} ', '')}"
-                log.warning(f"OperationId missing for {http_method.upper()} {path_template}, generated: {operation_id}")
+                operation_id = _synth_operation_id(http_method_upper, path_template)
+                log.warning(f"OperationId missing for {http_method_upper} {path_template}, generated: {operation_id}")
 
             method_name = to_java_variable_name(operation_id)
             summary = op_details.get('summary', '')
-            params = [] # Path, query, header params for the method signature
-            all_op_params = common_params + op_details.get('parameters', []) # Combine path and op params
-
-            path_params_in_sig = set()
-
-            for param_details in all_op_params:
-                param_name = param_details.get('name')
-                param_in = param_details.get('in')
-                param_schema = param_details.get('schema', {})
-
-                if param_in in ['path', 'query']:
-                    java_param_name = to_java_variable_name(param_name)
-                    java_param_type = get_java_type(param_schema, model_package, imports)
-                    params.append({
-                        'name': java_param_name,
-                        'type': java_param_type,
-                        'original_name': param_name,
-                        'in': param_in,
-                        'description': param_details.get('description', '')
-                    })
-                    if param_in == 'path':
-                         path_params_in_sig.add(java_param_name)
-                # TODO: Handle header params if needed in method sig (less common)
+            # Path and query params for the method signature, from path-level then operation-level params
+            # TODO: Handle header params if needed in method sig (less common)
+            params = [
+                _build_client_param(param_details, model_package, imports)
+                for param_details in chain(common_params, op_details.get('parameters', ()))
+                if param_details.get('in') in _SIGNATURE_PARAM_LOCATIONS
+            ]
+            path_params_in_sig = {p['name'] for p in params if p['in'] == 'path'}
 
             # Handle request body
             request_body_details = op_details.get('requestBody')
@@ -517,18 +685,18 @@ def _generate_backend_client(
                     response_schema = json_content['schema']
                     return_type_simple = get_java_type(response_schema, model_package, imports)
                     # Wrap in BackendResponse
-                    imports.add(f"{model_package}.{BACKEND_RESPONSE_BASE}")
+                    uses_backend_response = True
                     return_type = BACKEND_RESPONSE_BASE # All methods return the wrapper
                     response_pojo_type = return_type_simple # Store the actual payload type
                 elif success_response.get('description'): # Has description but no content schema
                      # Still return BackendResponse, payload will be null
-                     imports.add(f"{model_package}.{BACKEND_RESPONSE_BASE}")
+                     uses_backend_response = True
                      return_type = BACKEND_RESPONSE_BASE
                      response_pojo_type = 'Void' # Indicate no expected payload body
 
             # Handle DELETE 204 No Content
-            if http_method.upper() == 'DELETE' and '204' in op_details.get('responses', {}):
-                 imports.add(f"{model_package}.{BACKEND_RESPONSE_BASE}")
+            if http_method_upper == 'DELETE' and '204' in op_details.get('responses', {}):
+                 uses_backend_response = True
                  return_type = BACKEND_RESPONSE_BASE # Return wrapper even for 204
                  response_pojo_type = 'Void' # Indicate no expected payload body
 
@@ -536,7 +704,7 @@ def _generate_backend_client(
             method_data = {
                 'name': method_name,
                 'summary': summary,
-                'http_method': http_method.upper(),
+                'http_method': http_method_upper,
                 'endpoint_path_template': path_template,
                 'params': params,
                 'path_params_in_sig': list(path_params_in_sig),
@@ -547,6 +715,11 @@ def _generate_backend_client(
                 'response_content_type': response_content_type
             }
             methods.append(method_data)
+            if http_method_upper == 'GET':
+                if first_any_get is None:
+                    first_any_get = method_data
+                if first_paramless_get is None and not params:
+                    first_paramless_get = method_data
 
             # [STEP 1] Store metadata keyed by operationId (or fallback ID)
             client_method_metadata[operation_id] = {
@@ -571,14 +744,12 @@ def _generate_backend_client(
     }
     # Find a simple GET endpoint to use for test connection, preferably root or /items
     # Simplistic choice: use the first generated GET method's details if possible
-    first_get_method = next((m for m in methods if m['http_method'] == 'GET' and not m['params']), None) # Prefer GET with no params
-    if not first_get_method:
-        first_get_method = next((m for m in methods if m['http_method'] == 'GET'), None) # Any GET
+    first_get_method = first_paramless_get or first_any_get # Prefer GET with no params, else any GET
 
     if first_get_method:
         test_connect_method['endpoint_path_template'] = first_get_method['endpoint_path_template']
         test_connect_method['target_call_name'] = first_get_method['name'] # Call this generated method
-        test_connect_method['target_call_args'] = {p['name']:None for p in first_get_method['params']} # Pass null/default for args
+        test_connect_method['target_call_args'] = dict.fromkeys(p['name'] for p in first_get_method['params']) # Pass null/default for args
         log.info(f"Using endpoint '{test_connect_method['endpoint_path_template']}' for testConnection.")
     else:
         log.warning("Could not find suitable GET endpoint for testConnection method. It will likely fail.")
@@ -588,23 +759,26 @@ def _generate_backend_client(
 
     methods.append(test_connect_method)
 
+    if uses_backend_response:
+        imports.add(f"{model_package}.{BACKEND_RESPONSE_BASE}")
+
     # Determine authentication details for the client template
     auth_details = _prepare_auth_details(openapi_spec)
 
     context = {
         'package_name': client_package,
         'class_name': class_name,
-        'imports': sorted(list(imports)),
+        'imports': tuple(sorted(imports)),
         'methods': methods,
         'model_package': model_package,
         'auth_details': auth_details,
         'connection_properties_enum': f"{INJECTABLE_PROPS_ENUM}.CONNECTION_CONFIGURATION" # Pass enum reference
     }
 
-    output_file = os.path.join(client_path, f"{class_name}.java")
+    output_file = client_path / f"{class_name}.java"
     render('java/Client.java.j2', context, output_file)
 
-    print(f"DEBUG: Generated {class_name}.java") # DEBUG
+    log.debug("Queued %s.java", class_name)
     return class_name, client_method_metadata # [STEP 1] Return metadata
 
 def _prepare_auth_details(openapi_spec: OpenAPISpec) -> Dict:
@@ -660,135 +834,80 @@ def _prepare_auth_details(openapi_spec: OpenAPISpec) -> Dict:
 def _generate_type_converters(
     openapi_spec: OpenAPISpec,
     mapping_spec: MappingSpec,
-    package_name: str,
-    base_path: str,
+    subpackages: Dict[str, str],
+    converter_path: PurePath,
     render: Callable,
     operations: Set[str],
     generated_models: Set[str],
-    client_method_metadata: Dict[str, Dict] # [STEP 2] Receive client metadata
+    client_method_metadata_json: str # [STEP 2] Receive client metadata, serialized once by the caller
 ) -> tuple[Optional[str], Optional[str]]:
     """Generates the LdapToBackendRequestConverter and BackendToLdapResponseConverter classes."""
     log.info("  Generating Type Converters...")
-    print("DEBUG: Entering _generate_type_converters") # DEBUG
-    converter_path = os.path.join(base_path, 'converter')
-    os.makedirs(converter_path, exist_ok=True)
-    converter_package = f"{package_name}.converter"
-    model_package = f"{package_name}.model"
+    log.debug("Entering _generate_type_converters")
+    converter_package = subpackages['converter']
+    model_package = subpackages['model']
 
     req_converter_class_name = "LdapToBackendRequestConverter"
     resp_converter_class_name = "BackendToLdapResponseConverter"
 
+    # Context shared by both converters; both render the same compiled Converter.java.j2
+    base_context = {
+        'package_name': converter_package,
+        'model_package': model_package,
+        # ** Pass client method metadata to the template ** [STEP 2]
+        'client_method_metadata_json': client_method_metadata_json
+    }
+
     # --- Generate LdapToBackendRequestConverter --- [STEP 2]
-    req_imports = set([
-        f"{model_package}.*",
-        MANAGED_COMPONENT_ANNOTATION,
-        CONVERTER_INTERFACE,
-        f"{SDK_PACKAGE}.dn.DN",
-        f"{SDK_PACKAGE}.filter.Filter",
-        f"{SDK_PACKAGE}.filter.FilterType",
-        f"{SDK_PACKAGE}.filter.FilterVisitor",
-        LDAP_REQUEST_CLASS,
-        SEARCH_REQUEST_CLASS,
-        ADD_REQUEST_CLASS,
-        MODIFY_REQUEST_CLASS,
-        DELETE_REQUEST_CLASS,
-        "java.util.ArrayList",
-        "java.util.Collections",
-        "java.util.HashMap",
-        "java.util.List",
-        "java.util.Map",
-        "java.util.Set",
-        "javax.naming.NamingException",
-        "javax.naming.directory.Attribute",
-        "javax.naming.directory.Attributes",
-        "javax.naming.directory.ModificationItem",
-        "javax.naming.directory.DirContext", # For modification op constants
-        "org.slf4j.Logger",
-        "org.slf4j.LoggerFactory",
-        "com.fasterxml.jackson.databind.ObjectMapper", # For mapping load and POJO mapping
-        # For reflection in mapAttributesToPojo
-        "java.lang.reflect.Method",
-        "java.lang.reflect.InvocationTargetException",
-        "java.math.BigDecimal", # For number conversions
-        "java.time.LocalDate",
-        "java.time.OffsetDateTime",
-        "java.time.format.DateTimeParseException"
-    ])
+    req_imports = {f"{model_package}.*"} # Extras on top of _REQ_CONVERTER_BASE_IMPORTS
     # Add specific POJO imports
     # for model in generated_models:
     #      req_imports.add(f"{model_package}.{model}")
 
     # Context needs info to find the right client method
     req_context = {
-        'package_name': converter_package,
+        **base_context,
         'class_name': req_converter_class_name,
-        'imports': sorted(list(req_imports)),
+        'imports': _merge_sorted_imports(_REQ_CONVERTER_BASE_IMPORTS_SORTED, _REQ_CONVERTER_BASE_IMPORTS, req_imports),
         'input_type': 'LdapRequest', # Base type
         'output_type': BACKEND_REQUEST_BASE, # Base type
-        'converter_type': 'request', # Flag for template conditional logic
-        'model_package': model_package,
-        # ** Pass client method metadata to the template ** [STEP 2]
-        'client_method_metadata_json': json.dumps(client_method_metadata or {})
+        'converter_type': 'request' # Flag for template conditional logic
     }
 
-    output_file_req = os.path.join(converter_path, f"{req_converter_class_name}.java")
+    output_file_req = converter_path / f"{req_converter_class_name}.java"
     # Assuming Converter.java.j2 handles both request and response based on 'converter_type'
     render('java/Converter.java.j2', req_context, output_file_req)
 
     # --- Generate BackendToLdapResponseConverter ---
-    resp_imports = set([
-        f"{model_package}.*",
-        MANAGED_COMPONENT_ANNOTATION,
-        CONVERTER_INTERFACE,
-        f"{SDK_PACKAGE}.dn.DN",
-        RESPONSE_ENTITY_CLASS,
-        RESPONSE_STATUS_ENUM,
-        SEARCH_RESULT_ENTRY_CLASS,
-        "java.lang.reflect.Method",
-        "java.util.ArrayList",
-        "java.util.Collection",
-        "java.util.Collections",
-        "java.util.List",
-        "java.util.Map",
-        "java.util.Optional",
-        "javax.naming.NamingException",
-        "javax.naming.directory.Attribute",
-        "javax.naming.directory.Attributes",
-        "javax.naming.directory.BasicAttribute",
-        "javax.naming.directory.BasicAttributes",
-        "org.slf4j.Logger",
-        "org.slf4j.LoggerFactory",
-        "com.fasterxml.jackson.databind.ObjectMapper" # For mapping load
-    ])
+    resp_imports = {f"{model_package}.*"} # Extras on top of _RESP_CONVERTER_BASE_IMPORTS
 
     # The response converter might return different types (ResponseEntity, List<SearchResultEntry>)
     # The TypeConverter interface takes specific types. Here, we define it as converting
     # BackendResponse -> Object, and the logic inside determines the actual return.
     # This matches the explicit call pattern used in the Connector template for search.
     resp_context = {
-        'package_name': converter_package,
+        **base_context,
         'class_name': resp_converter_class_name,
-        'imports': sorted(list(resp_imports)),
+        'imports': _merge_sorted_imports(_RESP_CONVERTER_BASE_IMPORTS_SORTED, _RESP_CONVERTER_BASE_IMPORTS, resp_imports),
         'input_type': BACKEND_RESPONSE_BASE,
         'output_type': 'Object', # Generic output, convert method determines actual type
         'converter_type': 'response', # Flag for template conditional logic
-        'model_package': model_package,
-        'ldap_search_result_entry_type_simple': SEARCH_RESULT_ENTRY_CLASS.split('.')[-1],
-        'ldap_response_entity_type_simple': RESPONSE_ENTITY_CLASS.split('.')[-1],
-        'response_status_enum_simple': RESPONSE_STATUS_ENUM.split('.')[-1],
-        'client_method_metadata_json': json.dumps(client_method_metadata or {}) # Pass metadata for context if needed
+        'ldap_search_result_entry_type_simple': SEARCH_RESULT_ENTRY_SIMPLE,
+        'ldap_response_entity_type_simple': RESPONSE_ENTITY_SIMPLE,
+        'response_status_enum_simple': RESPONSE_STATUS_SIMPLE
     }
 
-    output_file_resp = os.path.join(converter_path, f"{resp_converter_class_name}.java")
+    output_file_resp = converter_path / f"{resp_converter_class_name}.java"
     render('java/Converter.java.j2', resp_context, output_file_resp)
 
-    print(f"DEBUG: Generated {req_converter_class_name}.java and {resp_converter_class_name}.java")
+    log.debug("Queued %s.java and %s.java", req_converter_class_name, resp_converter_class_name)
     return req_converter_class_name, resp_converter_class_name
 
 def _generate_main_connector(
     openapi_spec: OpenAPISpec,
     mapping_spec: MappingSpec,
     package_name: str,
+    subpackages: Dict[str, str],
     base_path: str,
     render: Callable,
     operations: Set[str],
@@ -796,34 +915,20 @@ def _generate_main_connector(
     req_converter_class_name: Optional[str],
     resp_converter_class_name: Optional[str],
     generated_models: Set[str],
-    client_method_metadata: Dict[str, Dict] # [STEP 3] Receive client metadata
+    client_method_metadata_json: str # [STEP 3] Receive client metadata, serialized once by the caller
 ):
     """Generates the main Connector class."""
     log.info("  Generating Main Connector Class...")
-    print("DEBUG: Entering _generate_main_connector") # DEBUG
+    log.debug("Entering _generate_main_connector")
 
-    api_title = openapi_spec.data.get('info', {}).get('title', 'GenericApi')
+    api_title = openapi_spec.info.get('title', 'GenericApi')
     class_name = f"{to_java_class_name(api_title)}Connector"
 
-    model_package = f"{package_name}.model"
-    client_package = f"{package_name}.client"
-    converter_package = f"{package_name}.converter"
-
-    imports = set([
-        MANAGED_COMPONENT_ANNOTATION,
-        CUSTOM_CONNECTOR_ANNOTATION,
-        INJECT_ANNOTATION,
-        f"{model_package}.*",
-        RESPONSE_ENTITY_CLASS,
-        RESPONSE_STATUS_ENUM,
-        SEARCH_RESULT_ENTRY_CLASS,
-        "java.io.IOException", # For catching client exceptions
-        "java.util.Collections",
-        "java.util.List",
-        "java.util.Map", # For metadata loading
-        "org.slf4j.Logger",
-        "org.slf4j.LoggerFactory"
-    ])
+    model_package = subpackages['model']
+    client_package = subpackages['client']
+    converter_package = subpackages['converter']
+
+    imports = {f"{model_package}.*"} # Extras on top of _MAIN_CONNECTOR_BASE_IMPORTS
 
     interfaces = []
     injected_fields = []
@@ -851,8 +956,8 @@ def _generate_main_connector(
     # Add operation interfaces based on detected operations
     backend_request_type_simple = BACKEND_REQUEST_BASE
     backend_response_type_simple = BACKEND_RESPONSE_BASE
-    ldap_search_result_entry_type_simple = SEARCH_RESULT_ENTRY_CLASS.split('.')[-1]
-    ldap_response_entity_type_simple = RESPONSE_ENTITY_CLASS.split('.')[-1]
+    ldap_search_result_entry_type_simple = SEARCH_RESULT_ENTRY_SIMPLE
+    ldap_response_entity_type_simple = RESPONSE_ENTITY_SIMPLE
 
     # Assuming usage of BackendRequest/Response types with converters
     if "Search" in operations:
@@ -883,7 +988,7 @@ def _generate_main_connector(
     context = {
         'package_name': package_name,
         'class_name': class_name,
-        'imports': sorted(list(imports)),
+        'imports': _merge_sorted_imports(_MAIN_CONNECTOR_BASE_IMPORTS_SORTED, _MAIN_CONNECTOR_BASE_IMPORTS, imports),
         'interfaces': interfaces,
         'injected_fields': injected_fields,
         'operations': operations,
@@ -892,14 +997,14 @@ def _generate_main_connector(
         'backend_response_type': backend_response_type_simple,
         'ldap_search_result_entry_type': ldap_search_result_entry_type_simple,
         'ldap_response_entity_type': ldap_response_entity_type_simple,
-        'response_status_enum_simple': RESPONSE_STATUS_ENUM.split('.')[-1],
+        'response_status_enum_simple': RESPONSE_STATUS_SIMPLE,
         'client_var_name': client_var_name,
         'resp_converter_class_name': resp_converter_class_name, # Pass name for explicit injection
         'generate_schema_extraction': "SchemaExtraction" in operations,
         # ** Pass client method metadata as JSON string ** [STEP 3]
-        'client_method_metadata_json': json.dumps(client_method_metadata or {})
+        'client_method_metadata_json': client_method_metadata_json
     }
 
-    output_file = os.path.join(base_path, f"{class_name}.java")
+    output_file = PurePath(base_path) / f"{class_name}.java"
     render('java/Connector.java.j2', context, output_file)
-    print(f"DEBUG: Generated {class_name}.java") # DEBUG
+    log.debug("Queued %s.java", class_name)
@@ -1,23 +1,32 @@
 import re
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 
 # Ensure absolute imports are used
 from parsers.openapi_parser import OpenAPISpec
 
+# Patterns used by the name helpers below, compiled once
+_NAME_SPLIT_RE = re.compile(r'[_-]')
+_LABEL_SEP_RE = re.compile(r'[_|-]+')
+_CAMEL_BOUNDARY_RE = re.compile(r'(?<!\s)(?<!^)(?=[A-Z])')
+
+# Scheme and key names recur across calls, so both name helpers are memoized
+@lru_cache(maxsize=1024)
 def _to_camel_case(snake_str: str) -> str:
     """Converts snake_case or kebab-case to camelCase."""
-    parts = re.split('_|-', snake_str)
+    parts = _NAME_SPLIT_RE.split(snake_str)
     # Ensure parts[0] exists and handle potential empty strings if split yields them unexpectedly
     first_part = parts[0] if parts else ''
     other_parts = [x.title() for x in parts[1:] if x] # Ensure parts are not empty
     return first_part + "".join(other_parts)
 
+@lru_cache(maxsize=1024)
 def _format_label(name: str) -> str:
     """Creates a human-readable label from a variable name."""
     # Replace underscores/hyphens with spaces
-    s = re.sub("[_|-]+", " ", name)
+    s = _LABEL_SEP_RE.sub(" ", name)
     # Add space before caps in camelCase (if not preceded by a space or start of string)
-    s = re.sub(r"(?<!\s)(?<!^)(?=[A-Z])", " ", s)
+    s = _CAMEL_BOUNDARY_RE.sub(" ", s)
     return s.title()
 
 def prepare_meta_context(
@@ -49,17 +58,14 @@ def prepare_meta_context(
         first_server = servers[0]
         default_url_value = first_server.get('url', '')
         variables = first_server.get('variables', {})
-        base_url_desc = "Base URL of the target API."
+        example_url = default_url_value
         if variables:
             # Construct an example URL with default variable values
-            example_url = default_url_value
             for var_name, var_details in variables.items():
                 # Replace {var} with its default value in the example
                 example_url = example_url.replace(f'{{{var_name}}}', var_details.get('default', f'<{var_name}>'))
-            base_url_desc += f" Example: {example_url}"
             # The default value for the input field should be the template URL itself
-        else:
-            base_url_desc += f" Example: {default_url_value}"
+        base_url_desc = f"Base URL of the target API. Example: {example_url}"
 
     properties.append({
         'name': 'baseUrl',
@@ -80,9 +86,21 @@ def prepare_meta_context(
         for req in global_security:
             required_schemes.update(req.keys())
 
+    # Schemes referenced anywhere: globally or by individual operations
+    used_schemes = set(required_schemes)
+    for path_item in openapi_spec.get_paths().values():
+        for operation in path_item.values():
+            if isinstance(operation, dict):
+                for req in operation.get('security') or ():
+                    used_schemes.update(req.keys())
+    # Specs that never declare security requirements still get properties for every scheme
+    filter_unused = bool(used_schemes)
+
     for name, scheme in security_schemes.items():
         if name in processed_security_schemes:
             continue
+        if filter_unused and name not in used_schemes:
+            continue # Defined but never required by the API
 
         scheme_type = scheme.get('type')
         required = name in required_schemes
@@ -95,9 +113,10 @@ def prepare_meta_context(
             # Prefer real key name for label/description if available
             prop_name_final = _to_camel_case(api_key_name if api_key_name else name)
             prop_label = _format_label(api_key_name if api_key_name else name)
-            prop_desc = f"API Key for authentication (sent as '{api_key_name}' in {api_key_in})."
+            desc_parts = [f"API Key for authentication (sent as '{api_key_name}' in {api_key_in})."]
             if scheme.get('description'):
-                prop_desc += f" {scheme.get('description')}"
+                desc_parts.append(scheme['description'])
+            prop_desc = ' '.join(desc_parts)
 
             properties.append({
                 'name': f'{prop_name_final}ApiKey',
@@ -114,20 +133,22 @@ def prepare_meta_context(
             prop_desc_base = scheme.get('description', '')
 
             if http_scheme == 'basic':
-                properties.append({
-                    'name': 'httpUsername',
-                    'label': 'HTTP Basic Username',
-                    'type': 'text',
-                    'required': required,
-                    'description': f"Username for HTTP Basic authentication. {prop_desc_base}".strip()
-                })
-                properties.append({
-                    'name': 'httpPassword',
-                    'label': 'HTTP Basic Password',
-                    'type': 'password',
-                    'required': required,
-                    'description': "Password for HTTP Basic authentication."
-                })
+                properties.extend((
+                    {
+                        'name': 'httpUsername',
+                        'label': 'HTTP Basic Username',
+                        'type': 'text',
+                        'required': required,
+                        'description': f"Username for HTTP Basic authentication. {prop_desc_base}".strip()
+                    },
+                    {
+                        'name': 'httpPassword',
+                        'label': 'HTTP Basic Password',
+                        'type': 'password',
+                        'required': required,
+                        'description': "Password for HTTP Basic authentication."
+                    },
+                ))
                 processed_security_schemes.add(name)
             elif http_scheme == 'bearer':
                  properties.append({
@@ -145,28 +166,35 @@ def prepare_meta_context(
             flows = scheme.get('flows', {})
             # Get first defined flow (e.g., 'authorizationCode', 'clientCredentials')
             # We might need more logic if multiple flows are defined
-            flow_type, flow_details = next(iter(flows.items()), (None, {}))
+            if flows:
+                flow_type = next(iter(flows))
+                flow_details = flows[flow_type]
+            else:
+                flow_type, flow_details = None, {}
             prop_label_base = _format_label(name)
             prop_desc_base = scheme.get('description', '')
 
-            # Common properties (might not apply to all flows)
-            properties.append({
-                'name': f'{prop_base_name}ClientId',
-                'label': f'{prop_label_base} OAuth Client ID',
-                'type': 'text',
-                'required': True, # Usually required
-                'description': f"Client ID for OAuth2 flow. {prop_desc_base}".strip()
-            })
             # Client secret is not used in implicit or PKCE-enhanced auth code flows
             # Let's assume it's required for simplicity unless specific flow indicates otherwise
             client_secret_required = flow_type not in ['implicit'] # Add other flows if needed
-            properties.append({
-                'name': f'{prop_base_name}ClientSecret',
-                'label': f'{prop_label_base} OAuth Client Secret',
-                'type': 'password',
-                'required': client_secret_required,
-                'description': "Client Secret for OAuth2 flow."
-            })
+            # Collected locally and added to properties in one go at the end of the branch
+            oauth_props = [
+                # Common properties (might not apply to all flows)
+                {
+                    'name': f'{prop_base_name}ClientId',
+                    'label': f'{prop_label_base} OAuth Client ID',
+                    'type': 'text',
+                    'required': True, # Usually required
+                    'description': f"Client ID for OAuth2 flow. {prop_desc_base}".strip()
+                },
+                {
+                    'name': f'{prop_base_name}ClientSecret',
+                    'label': f'{prop_label_base} OAuth Client Secret',
+                    'type': 'password',
+                    'required': client_secret_required,
+                    'description': "Client Secret for OAuth2 flow."
+                },
+            ]
 
             # Flow-specific properties
             auth_url = flow_details.get('authorizationUrl')
@@ -174,7 +202,7 @@ def prepare_meta_context(
             scopes = flow_details.get('scopes') # This is a dictionary {scope_name: description}
 
             if auth_url:
-                 properties.append({
+                 oauth_props.append({
                     'name': f'{prop_base_name}AuthorizationUrl',
                     'label': f'{prop_label_base} OAuth Authorization URL',
                     'type': 'text',
@@ -183,7 +211,7 @@ def prepare_meta_context(
                     'description': "OAuth2 Authorization Endpoint URL."
                  })
             if token_url:
-                 properties.append({
+                 oauth_props.append({
                     'name': f'{prop_base_name}TokenUrl',
                     'label': f'{prop_label_base} OAuth Token URL',
                     'type': 'text',
@@ -193,7 +221,7 @@ def prepare_meta_context(
                  })
             if scopes:
                  scope_string = ', '.join(scopes.keys())
-                 properties.append({
+                 oauth_props.append({
                     'name': f'{prop_base_name}Scopes',
                     'label': f'{prop_label_base} OAuth Scopes',
                     'type': 'text', # Simple text input for scopes
@@ -201,14 +229,14 @@ def prepare_meta_context(
                     'description': f"OAuth2 scopes required (comma-separated). Available: {scope_string}"
                  })
 
+            properties.extend(oauth_props)
             processed_security_schemes.add(name)
 
         # TODO: Handle openIdConnect, mutualTLS etc. if needed
 
     # Use info.title as default connector name if not provided
     # Default to 'Generated REST Connector' if title is missing
-    info_block = openapi_spec.data.get('info', {})
-    final_connector_name = connector_name or info_block.get('title', 'Generated REST Connector')
+    final_connector_name = connector_name or openapi_spec.info.get('title', 'Generated REST Connector')
 
     context = {
         'connector_name': final_connector_name,
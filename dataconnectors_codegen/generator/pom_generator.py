@@ -1,4 +1,5 @@
 from typing import Dict, Any
+from types import MappingProxyType
 import re
 
 # Ensure absolute imports are used
@@ -17,6 +18,16 @@ JSONPATH_VERSION = "2.9.0" # Jayway JsonPath
 # JAVA_VERSION = "11" # IDDM v8 likely requires Java 11 or 17 - Now passed as argument
 # --- End Configuration Constants ---
 
+# Context entries that are the same for every connector; prepare_pom_context overlays the rest
+_POM_STATIC_CTX = MappingProxyType({
+    'jsonpath_version': JSONPATH_VERSION,
+    'maven_compiler_plugin_version': MAVEN_COMPILER_PLUGIN_VERSION,
+    'maven_shade_plugin_version': MAVEN_SHADE_PLUGIN_VERSION,
+})
+
+# Runs of characters not allowed in an artifactId (alphanumeric, hyphen, underscore)
+_ARTIFACT_ID_INVALID_RE = re.compile(r'[^a-zA-Z0-9_-]+')
+
 def _generate_group_id(package_name: str) -> str:
     """Generates a plausible groupId from the package name."""
     parts = package_name.split('.')
@@ -35,11 +46,9 @@ def _generate_artifact_id(package_name: str, openapi_spec: OpenAPISpec) -> str:
         name = parts[-1]
     else:
         # Fallback to OpenAPI title or a generic name
-        title = openapi_spec.data.get('info', {}).get('title', 'GenericRestConnector')
-        # Sanitize title for use as artifactId (alphanumeric, hyphen, underscore)
-        name = re.sub(r'[^a-zA-Z0-9_-]+', '-', title).lower()
-        # Remove leading/trailing hyphens
-        name = name.strip('-')
+        title = openapi_spec.info.get('title', 'GenericRestConnector')
+        # Sanitize title for use as artifactId, removing leading/trailing hyphens
+        name = _ARTIFACT_ID_INVALID_RE.sub('-', title).lower().strip('-')
         if not name:
              name = "generated-connector"
 
@@ -75,20 +84,18 @@ def prepare_pom_context(
 
     group_id = _generate_group_id(package_name)
     artifact_id = _generate_artifact_id(package_name, openapi_spec)
-    version = openapi_spec.data.get('info', {}).get('version', '1.0.0') # Use API version if available
+    version = openapi_spec.info.get('version', '1.0.0') # Use API version if available
 
     context = {
+        **_POM_STATIC_CTX,
         'group_id': group_id,
         'artifact_id': artifact_id,
         'version': version,
-        'connector_name': openapi_spec.data.get('info', {}).get('title', artifact_id),
+        'connector_name': openapi_spec.info.get('title', artifact_id),
         'java_version': java_version, # Use passed argument
         'iddm_sdk_version': sdk_version, # Use passed argument
         'okhttp_version': okhttp_version, # Use passed argument
         'jackson_version': jackson_version, # Use passed argument
-        'jsonpath_version': JSONPATH_VERSION,
-        'maven_compiler_plugin_version': MAVEN_COMPILER_PLUGIN_VERSION,
-        'maven_shade_plugin_version': MAVEN_SHADE_PLUGIN_VERSION,
         # Add other necessary details here
     }
     return context
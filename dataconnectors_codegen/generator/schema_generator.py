@@ -1,16 +1,27 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, FrozenSet, Iterator, List, Optional, Set, NamedTuple, Tuple
 import logging
 import json # For potential JSONPath processing if needed later
 import re
+import sys
+from functools import lru_cache
 
 # Ensure absolute imports are used
 from parsers.openapi_parser import OpenAPISpec
 from parsers.mapping_parser import MappingSpec
 
+log = logging.getLogger(__name__)
+
 # Attempt to import jsonpath_ng
 try:
-    from jsonpath_ng import parse as jsonpath_parse
+    try:
+        from jsonpath_ng.ext.parser import ExtendedJsonPathParser
+    except ImportError: # Older jsonpath-ng releases only ship the misspelled name
+        from jsonpath_ng.ext.parser import ExtentedJsonPathParser as ExtendedJsonPathParser
     from jsonpath_ng.exceptions import JsonPathParserError
+    from jsonpath_ng.jsonpath import Child, Fields, Index, Root
+    # jsonpath_ng.parse() builds a new parser per call; one shared instance avoids that
+    _JSONPATH_PARSER = ExtendedJsonPathParser()
+    jsonpath_parse = _JSONPATH_PARSER.parse
     JSONPATH_SUPPORTED = True
 except ImportError:
     log.warning("jsonpath-ng library not found. JSONPath mapping support is disabled. pip install jsonpath-ng")
@@ -18,8 +29,6 @@ except ImportError:
     JsonPathParserError = Exception
     JSONPATH_SUPPORTED = False
 
-log = logging.getLogger(__name__)
-
 # Mapping from OpenAPI types/formats to ORX types
 # Keys are tuples: (openapi_type, openapi_format) or just (openapi_type, None)
 # Based on common ORX types: string, integer, long, double, boolean, generalizedTime, binary
@@ -47,6 +56,18 @@ ORX_TYPE_MAP = {
 # Fallback type if no match found
 DEFAULT_ORX_TYPE = "string"
 
+class ORXAttribute(NamedTuple):
+    """An attribute as consumed by schema.orx.j2 (field names match the template)."""
+    ldapName: str
+    type: str
+    primaryKey: bool
+    multiValued: bool
+    readOnly: Optional[bool]
+    required: bool
+
+# Type-only entries of ORX_TYPE_MAP, used when a type+format pair has no entry of its own
+_TYPE_ONLY_DEFAULTS = {t: orx for (t, f), orx in ORX_TYPE_MAP.items() if f is None}
+
 def _generate_default_ldap_name(openapi_prop_name: str) -> str:
     """Generates a default LDAP attribute name from an OpenAPI property name.
        Simple version: just use the property name.
@@ -58,82 +79,209 @@ def _generate_default_ldap_name(openapi_prop_name: str) -> str:
     # For now, keep it simple:
     return openapi_prop_name # Or add a prefix like 'api-' + openapi_prop_name
 
-def _get_openapi_schema_details(openapi_spec: OpenAPISpec, schema_ref: str) -> Optional[Dict[str, Any]]:
-    """Resolves a simple $ref link within the components/schemas or definitions."""
+def _get_openapi_schema_details(
+    schemas: Dict[str, Any],
+    schema_ref: str,
+    resolved_cache: Optional[Dict[str, Optional[Dict[str, Any]]]] = None,
+    visited_refs: Optional[Set[str]] = None
+) -> Optional[Dict[str, Any]]:
+    """Resolves a simple $ref link within the components/schemas or definitions.
+       A schema that is only an alias for another $ref is followed; visited_refs stops
+       circular aliases, and resolved_cache memoizes every ref resolved along the way.
+    """
+    if resolved_cache is not None and schema_ref in resolved_cache:
+        return resolved_cache[schema_ref]
+    if visited_refs is None:
+        visited_refs = set()
+    if schema_ref in visited_refs:
+        log.warning(f"Circular schema reference detected at: {schema_ref}")
+        return None
+
     if not schema_ref or not schema_ref.startswith('#/components/schemas/') and not schema_ref.startswith('#/definitions/'):
         log.warning(f"Cannot resolve non-local schema reference: {schema_ref}")
+        resolved = None
+    else:
+        visited_refs.add(schema_ref)
+        parts = schema_ref.split('/')
+        schema_name = parts[-1]
+        resolved = schemas.get(schema_name)
+        if isinstance(resolved, dict) and len(resolved) == 1 and '$ref' in resolved:
+            resolved = _get_openapi_schema_details(schemas, resolved['$ref'], resolved_cache, visited_refs)
+
+    if resolved_cache is not None:
+        resolved_cache[schema_ref] = resolved
+    return resolved
+
+# Plain dotted paths ('$.a.b.c') are walked directly without going through jsonpath-ng
+_SIMPLE_JSONPATH_RE = re.compile(r'\$(\.[A-Za-z_][A-Za-z0-9_]*)+')
+
+# Effective properties and required property names of a schema, allOf parts included
+FlattenedSchema = Tuple[Dict[str, Any], FrozenSet[str]]
+
+def _flatten_properties(
+    schema: Dict[str, Any],
+    schemas: Dict[str, Any],
+    resolved_cache: Optional[Dict[str, Optional[Dict[str, Any]]]] = None,
+    flattened_cache: Optional[Dict[int, FlattenedSchema]] = None,
+    _active: Optional[Set[int]] = None
+) -> FlattenedSchema:
+    """Returns the effective properties and required property names of a schema, merging in
+       those of its allOf parts. Parts may be $refs; the schema's own properties win over
+       inherited ones. flattened_cache memoizes the result per schema object.
+    """
+    if flattened_cache is not None and id(schema) in flattened_cache:
+        return flattened_cache[id(schema)]
+    top_level = _active is None
+    if top_level:
+        _active = set()
+    if id(schema) in _active:
+        return {}, frozenset() # allOf cycle; the properties are already being collected further up
+    _active.add(id(schema))
+
+    properties: Dict[str, Any] = {}
+    required: Set[str] = set()
+    for part in schema.get('allOf') or ():
+        if '$ref' in part:
+            part = _get_openapi_schema_details(schemas, part['$ref'], resolved_cache)
+        if isinstance(part, dict):
+            part_properties, part_required = _flatten_properties(part, schemas, resolved_cache, flattened_cache, _active)
+            properties.update(part_properties)
+            required.update(part_required)
+    properties.update(schema.get('properties') or {})
+    required.update(schema.get('required') or ())
+    _active.discard(id(schema)) # Only ancestors count as a cycle; a part shared by two branches is merged twice
+
+    result = (properties, frozenset(required))
+    # Results cut short by a cycle are only complete for the schema the walk started at
+    if flattened_cache is not None and top_level:
+        flattened_cache[id(schema)] = result
+    return result
+
+# Keys a {'$ref': ...} fragment may carry and still be treated as a plain reference
+_REF_ONLY_KEYS = frozenset(('$ref', 'description'))
+
+def _walk_schema_path(
+    schema: Dict[str, Any],
+    path_parts: List[str],
+    schemas: Optional[Dict[str, Any]] = None,
+    resolved_cache: Optional[Dict[str, Optional[Dict[str, Any]]]] = None,
+    flattened_cache: Optional[Dict[int, FlattenedSchema]] = None
+) -> Optional[Dict[str, Any]]:
+    """Follows path parts through nested 'properties' (and 'items' for numeric parts) of a schema.
+       When schemas is given, fragments that are only a $ref are resolved and allOf schemas are
+       flattened (as by _flatten_properties) so the walk can continue.
+    """
+    current_def = schema
+    visited_refs: Set[str] = set()
+    for part in path_parts:
+        if part == '$': continue
+        if schemas is not None and 'allOf' in current_def:
+             current_def = _flatten_properties(current_def, schemas, resolved_cache, flattened_cache)[0].get(part)
+        elif current_def.get('type') == 'object' and 'properties' in current_def:
+             current_def = current_def['properties'].get(part)
+        elif current_def.get('type') == 'array' and 'items' in current_def and part.isdigit():
+             # Path into array - use item definition
+             current_def = current_def['items']
+             # If path continues into array item's properties, need further logic
+        else:
+            current_def = None # Cannot navigate further
+
+        if current_def is None:
+            break
+        if schemas is not None and '$ref' in current_def and current_def.keys() <= _REF_ONLY_KEYS:
+            current_def = _get_openapi_schema_details(schemas, current_def['$ref'], resolved_cache, visited_refs)
+            if current_def is None:
+                break
+    return current_def
+
+def _jsonpath_field_parts(path_expr) -> Optional[List[str]]:
+    """Flattens a parsed JSONPath made only of single field names and indices into path parts.
+       Returns None for anything else (wildcards, slices, filters, unions).
+    """
+    parts = []
+    node = path_expr
+    # The parser nests steps to the left: '$.a[0].b' -> Child(Child(Child(Root(), Fields('a')), Index(0)), Fields('b'))
+    while isinstance(node, Child):
+        step = node.right
+        if isinstance(step, Fields) and len(step.fields) == 1 and step.fields[0] != '*':
+            parts.append(step.fields[0])
+        elif isinstance(step, Index):
+            indices = getattr(step, 'indices', None) or (step.index,) # 'index' before jsonpath-ng 1.6
+            if len(indices) != 1:
+                return None
+            parts.append(str(indices[0]))
+        else:
+            return None
+        node = node.left
+    if isinstance(node, Fields) and len(node.fields) == 1 and node.fields[0] != '*':
+        parts.append(node.fields[0]) # Relative path without a leading '$'
+    elif not isinstance(node, Root):
         return None
-
-    parts = schema_ref.split('/')
-    schema_name = parts[-1]
-    schemas = openapi_spec.get_schemas()
-    return schemas.get(schema_name)
-
-def _get_openapi_definition_by_path(schema: Dict[str, Any], json_path: str) -> Optional[Dict[str, Any]]:
+    parts.reverse()
+    return parts
+
+@lru_cache(maxsize=512)
+def _cached_jsonpath_parse(json_path: str):
+    """Parses a JSONPath expression once; mappings reuse the same paths across attributes and object classes."""
+    return jsonpath_parse(json_path)
+
+def _get_openapi_definition_by_path(
+    schema: Dict[str, Any],
+    json_path: str,
+    schemas: Optional[Dict[str, Any]] = None,
+    resolved_cache: Optional[Dict[str, Optional[Dict[str, Any]]]] = None,
+    flattened_cache: Optional[Dict[int, FlattenedSchema]] = None
+) -> Optional[Dict[str, Any]]:
     """Attempts to find the OpenAPI schema definition fragment corresponding to a JSONPath.
-       NOTE: This is a basic implementation. It doesn't fully resolve $refs within the path.
+       NOTE: This is a basic implementation. Only $ref-only fragments and allOf schemas along
+       the path are resolved, and only when the schemas map is passed in.
     """
-    if not JSONPATH_SUPPORTED:
-        return None
-
     try:
-        path_expr = jsonpath_parse(json_path)
+        if _SIMPLE_JSONPATH_RE.fullmatch(json_path):
+            return _walk_schema_path(schema, json_path.split('.'), schemas, resolved_cache, flattened_cache)
+
+        if not JSONPATH_SUPPORTED:
+            return None
+
+        path_expr = _cached_jsonpath_parse(json_path)
         # We assume the path targets a property within the schema. We need the *definition*.
         # This is complex. For simple paths like '$.name' or '$.address.street', we can try.
         # Path: '$.prop1.prop2' -> Find schema[properties][prop1][properties][prop2]
-        current_def = schema
-        if isinstance(path_expr, jsonpath_ng.fields.Fields):
-             path_parts = str(path_expr).split('.') # Simple dot notation split
-             for part in path_parts:
-                 if part == '$': continue
-                 if current_def.get('type') == 'object' and 'properties' in current_def:
-                      current_def = current_def['properties'].get(part)
-                 elif current_def.get('type') == 'array' and 'items' in current_def and part.isdigit():
-                      # Path into array - use item definition
-                      current_def = current_def['items']
-                      # If path continues into array item's properties, need further logic
-                 else:
-                     current_def = None # Cannot navigate further
-
-                 if current_def is None:
-                     break
-             return current_def
+        path_parts = _jsonpath_field_parts(path_expr)
+        if path_parts is not None:
+             return _walk_schema_path(schema, path_parts, schemas, resolved_cache, flattened_cache)
         else:
             # Handle more complex JSONPath expressions (filters, wildcards) - Very difficult to map back to schema def
             log.warning(f"Cannot reliably find OpenAPI definition for complex JSONPath: {json_path}")
             return None # Cannot determine definition for complex paths easily
 
-    except (JsonPathParserError, AttributeError, KeyError, IndexError) as e:
+    # TypeError/AttributeError: a fragment along the path is not a dict (e.g. an OpenAPI 3.1 boolean schema)
+    except (JsonPathParserError, AttributeError, KeyError, IndexError, TypeError) as e:
         log.warning(f"Error processing JSONPath '{json_path}' to find schema definition: {e}")
         return None
     return None
 
+def _resolve_items_type(items_details: Dict[str, Any]) -> str:
+    """Returns the ORX type of each value of an array, defaulting to a multi-valued string."""
+    items_type = items_details.get('type', 'string')
+    return (ORX_TYPE_MAP.get((items_type, items_details.get('format')))
+            or _TYPE_ONLY_DEFAULTS.get(items_type, DEFAULT_ORX_TYPE))
+
 def _infer_attribute_type(prop_details: Dict[str, Any], attr_mapping: Dict[str, Any]) -> str:
     """Infers the ORX attribute type from OpenAPI schema property details and mapping overrides."""
     if attr_mapping.get('typeOverride'):
-        return attr_mapping['typeOverride']
+        # ORX_TYPE_MAP values are literals (already interned); overrides come from the mapping file
+        return sys.intern(attr_mapping['typeOverride'])
 
     openapi_type = prop_details.get('type', 'string')
     openapi_format = prop_details.get('format')
 
     if openapi_type == 'array':
-        items_details = prop_details.get('items', {})
-        items_type = items_details.get('type', 'string')
-        items_format = items_details.get('format')
-        # Get type based on array items, default to string array (multi-valued string)
-        # ORX represents multi-valued attributes, the type is the type of *each* value.
-        # If the items have a specific format, use it.
-        item_orx_type = ORX_TYPE_MAP.get((items_type, items_format),
-                                        ORX_TYPE_MAP.get((items_type, None), DEFAULT_ORX_TYPE))
-        return item_orx_type # The type definition in ORX refers to the type of each value in the multi-valued attribute
-
-    # Look for specific type+format combination first
-    orx_type = ORX_TYPE_MAP.get((openapi_type, openapi_format))
-    if orx_type:
-        return orx_type
+        # The type definition in ORX refers to the type of each value in the multi-valued attribute
+        return _resolve_items_type(prop_details.get('items', {}))
 
-    # Fallback to type only
-    orx_type = ORX_TYPE_MAP.get((openapi_type, None))
+    # Specific type+format combination first, then the type-only default
+    orx_type = ORX_TYPE_MAP.get((openapi_type, openapi_format)) or _TYPE_ONLY_DEFAULTS.get(openapi_type)
     if orx_type:
         return orx_type
 
@@ -141,29 +289,22 @@ def _infer_attribute_type(prop_details: Dict[str, Any], attr_mapping: Dict[str,
     log.debug(f"Unknown OpenAPI type/format combination: type='{openapi_type}', format='{openapi_format}'. Defaulting to '{DEFAULT_ORX_TYPE}'.")
     return DEFAULT_ORX_TYPE
 
-def prepare_schema_context(openapi_spec: OpenAPISpec, mapping_spec: MappingSpec) -> Dict[str, Any]:
+def _iter_object_classes(openapi_spec: OpenAPISpec, mapping_spec: MappingSpec) -> Iterator[Dict[str, Any]]:
+    """Yields the schema.orx entry of each mapped object class that resolves to an OpenAPI schema.
+       Attributes are collected per object class, since the primary key check needs all of them.
     """
-    Prepares the context dictionary needed to render the schema.orx template.
-
-    Generates attributes based *only* on the attributes defined in the mapping_spec.
-    It uses the mapping's jsonPath to find the corresponding definition within
-    the linked OpenAPI schema to infer type and other details.
-
-    Args:
-        openapi_spec: The parsed OpenAPI specification object.
-        mapping_spec: The parsed mapping specification object.
-
-    Returns:
-        A dictionary containing data for the Jinja2 template.
-    """
-    object_classes = []
     defined_ldap_ocs = mapping_spec.get_ldap_object_classes()
 
     if not defined_ldap_ocs:
         log.warning("No object classes defined in the mapping file. Schema will be empty.")
-        return {"object_classes": []}
+        return
 
     all_openapi_schemas = openapi_spec.get_schemas()
+    # Per-run memos: object classes often share a schema ref, and attributes a JSONPath
+    resolved_refs: Dict[str, Optional[Dict[str, Any]]] = {}
+    visited_refs: Set[str] = set()
+    path_definitions: Dict[tuple, Optional[Dict[str, Any]]] = {}
+    flattened_schemas: Dict[int, FlattenedSchema] = {}
 
     for ldap_oc_name in defined_ldap_ocs:
         oc_mapping = mapping_spec.get_object_class_mapping(ldap_oc_name)
@@ -178,7 +319,7 @@ def prepare_schema_context(openapi_spec: OpenAPISpec, mapping_spec: MappingSpec)
         source_schema = None
 
         if openapi_schema_ref:
-            source_schema = _get_openapi_schema_details(openapi_spec, openapi_schema_ref)
+            source_schema = _get_openapi_schema_details(all_openapi_schemas, openapi_schema_ref, resolved_refs, visited_refs)
         elif openapi_schema_name:
             source_schema = all_openapi_schemas.get(openapi_schema_name)
         else:
@@ -192,16 +333,24 @@ def prepare_schema_context(openapi_spec: OpenAPISpec, mapping_spec: MappingSpec)
         attributes = []
         primary_key_ldap_attr = oc_mapping.get('primaryKeyLdapAttribute')
         mapped_attributes_list = oc_mapping.get('attributes', [])
+        # Object classes sharing a source schema share its flattened property map. OpenAPI lists
+        # required properties on the parent schema (and its allOf parts), not on each property
+        source_properties, required_props = _flatten_properties(
+            source_schema, all_openapi_schemas, resolved_refs, flattened_schemas)
 
         # Iterate through the attributes DEFINED IN THE MAPPING FILE
         for attr_mapping in mapped_attributes_list:
-            ldap_attr_name = attr_mapping.get('ldapName')
+            # Bound once per attribute; the lookups below run for every mapped attribute
+            am_get = attr_mapping.get
+            ldap_attr_name = am_get('ldapName')
             if not ldap_attr_name:
                 log.warning(f"Attribute mapping found under OC '{ldap_oc_name}' is missing 'ldapName'. Skipping.")
                 continue
+            # The same LDAP names recur across object classes; share one string object per name
+            ldap_attr_name = sys.intern(ldap_attr_name)
 
-            json_path = attr_mapping.get('jsonPath')
-            openapi_prop_name = attr_mapping.get('openApiPropertyName')
+            json_path = am_get('jsonPath')
+            openapi_prop_name = am_get('openApiPropertyName')
 
             if not json_path and not openapi_prop_name:
                  log.warning(f"Attribute '{ldap_attr_name}' for OC '{ldap_oc_name}' has neither 'jsonPath' nor 'openApiPropertyName'. Cannot infer type. Skipping.")
@@ -213,13 +362,18 @@ def prepare_schema_context(openapi_spec: OpenAPISpec, mapping_spec: MappingSpec)
             target_path_for_type_inference = None
 
             if json_path and JSONPATH_SUPPORTED:
-                prop_details = _get_openapi_definition_by_path(source_schema, json_path)
+                path_key = (id(source_schema), json_path)
+                if path_key in path_definitions:
+                    prop_details = path_definitions[path_key]
+                else:
+                    prop_details = path_definitions[path_key] = _get_openapi_definition_by_path(
+                        source_schema, json_path, all_openapi_schemas, resolved_refs, flattened_schemas)
                 target_path_for_type_inference = json_path
                 if not prop_details:
                     log.warning(f"Could not find OpenAPI definition fragment using JSONPath '{json_path}' for attribute '{ldap_attr_name}' in OC '{ldap_oc_name}'. Type inference might be inaccurate.")
             elif openapi_prop_name:
                 # Fallback to simple property name lookup
-                prop_details = source_schema.get('properties', {}).get(openapi_prop_name)
+                prop_details = source_properties.get(openapi_prop_name)
                 target_path_for_type_inference = openapi_prop_name
                 if not prop_details:
                     log.warning(f"Could not find OpenAPI property '{openapi_prop_name}' for attribute '{ldap_attr_name}' in OC '{ldap_oc_name}'. Type inference might be inaccurate.")
@@ -229,12 +383,16 @@ def prepare_schema_context(openapi_spec: OpenAPISpec, mapping_spec: MappingSpec)
                 prop_details = {} # Use empty dict to allow defaults
 
             # Infer type, required status, etc. from the found definition
+            pd_get = prop_details.get
             attr_type = _infer_attribute_type(prop_details, attr_mapping)
-            is_multi_valued = prop_details.get('type') == 'array'
+            is_multi_valued = pd_get('type') == 'array'
             is_primary_key = False
             is_read_only = None # Will be None unless set by mapping
-            # Infer required status from OpenAPI schema first
-            is_required = prop_details.get('required', False)
+            # Infer required status from OpenAPI schema first (top-level properties only)
+            required_key = target_path_for_type_inference
+            if required_key and required_key.startswith('$.'):
+                required_key = required_key[2:]
+            is_required = required_key in required_props
 
             if attr_mapping:
                 # Use details from the mapping file
@@ -245,16 +403,16 @@ def prepare_schema_context(openapi_spec: OpenAPISpec, mapping_spec: MappingSpec)
                 if 'required' in attr_mapping:
                     is_required = attr_mapping['required']
 
-            attributes.append({
-                'ldapName': ldap_attr_name,
-                'type': attr_type,
-                'primaryKey': is_primary_key,
-                'multiValued': is_multi_valued,
-                'readOnly': is_read_only, # Include flag (True/False)
-                'required': is_required # Include flag
-            })
+            attributes.append(ORXAttribute(
+                ldapName=ldap_attr_name,
+                type=attr_type,
+                primaryKey=is_primary_key,
+                multiValued=is_multi_valued,
+                readOnly=is_read_only, # Include flag (True/False)
+                required=is_required # Include flag
+            ))
 
-        if not primary_key_ldap_attr or not any(a['primaryKey'] for a in attributes):
+        if not primary_key_ldap_attr or not any(a.primaryKey for a in attributes):
             # If primary key was specified in mapping but not found/mapped, treat as error for this OC
             if primary_key_ldap_attr:
                 log.error(f"Mapped primary key attribute '{primary_key_ldap_attr}' for object class '{ldap_oc_name}' was not found in the OpenAPI schema properties or its mapping is invalid. Skipping this object class.")
@@ -263,10 +421,25 @@ def prepare_schema_context(openapi_spec: OpenAPISpec, mapping_spec: MappingSpec)
                 log.warning(f"No primary key attribute was specified or successfully mapped for object class '{ldap_oc_name}'. Operations like search-by-DN might fail.")
                 # Continue processing, but be aware operations might be limited
 
-        object_classes.append({
+        yield {
             'ldapName': ldap_oc_name,
             'attributes': attributes
             # Add backend name/resource mapping if needed by template
-        })
+        }
+
+def prepare_schema_context(openapi_spec: OpenAPISpec, mapping_spec: MappingSpec) -> Dict[str, Any]:
+    """
+    Prepares the context dictionary needed to render the schema.orx template.
 
-    return {"object_classes": object_classes}
+    Generates attributes based *only* on the attributes defined in the mapping_spec.
+    It uses the mapping's jsonPath to find the corresponding definition within
+    the linked OpenAPI schema to infer type and other details.
+
+    Args:
+        openapi_spec: The parsed OpenAPI specification object.
+        mapping_spec: The parsed mapping specification object.
+
+    Returns:
+        A dictionary containing data for the Jinja2 template.
+    """
+    return {"object_classes": list(_iter_object_classes(openapi_spec, mapping_spec))}
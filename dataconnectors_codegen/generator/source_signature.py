@@ -0,0 +1,20 @@
+import hashlib
+import os
+
+# Root of the generator package; every source and template under it is part of the signature.
+# This module only depends on the standard library, so tools outside the package (e.g. the
+# smoke test runner) can import it without pulling in the generator itself.
+PACKAGE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Generated or cached files that live inside the package but are not generator sources
+_IGNORED_DIRS = ('__pycache__', '.jinja_cache')
+
+def source_signature() -> str:
+    """Hash of the path, size and mtime of every generator source and template in the package."""
+    parts = []
+    for dirpath, dirnames, filenames in os.walk(PACKAGE_DIR):
+        dirnames[:] = sorted(d for d in dirnames if d not in _IGNORED_DIRS)
+        for name in sorted(filenames):
+            st = os.stat(os.path.join(dirpath, name))
+            parts.append(f"{os.path.relpath(os.path.join(dirpath, name), PACKAGE_DIR)}:{st.st_size}:{st.st_mtime_ns}")
+    return hashlib.blake2b("\n".join(parts).encode('utf-8'), digest_size=16).hexdigest()
@@ -1,44 +1,45 @@
 import click
+import logging
 import os
 import traceback
 import sys
 
-# **** ADD PRINT HERE ****
-print("DEBUG: Loading dataconnectors_codegen/main.py module")
+log = logging.getLogger(__name__)
+log.debug("Loading dataconnectors_codegen/main.py module")
 
 # Ensure absolute imports are used
 # Assuming execution from project root or package structure is handled correctly
 try:
     from .parsers.openapi_parser import load_openapi_spec
     from .parsers.mapping_parser import load_mapping_spec
+    from .parsers.json_io import read_json, write_json
     from .generator.engine import GeneratorEngine
 except ImportError:
     # Fallback for direct script execution or different environment setup
     from parsers.openapi_parser import load_openapi_spec
     from parsers.mapping_parser import load_mapping_spec
+    from parsers.json_io import read_json, write_json
     from generator.engine import GeneratorEngine
-print("DEBUG: Imported parsers and engine in main.py") # DEBUG
+log.debug("Imported parsers and engine in main.py")
 
 # --- Core Logic Function (undecorated) ---
-def run_generation(openapi: str, mapping: str, output: str, package_name: str, sdk_version: str, java_version: str, schema_extraction: bool, okhttp_version: str, jackson_version: str, no_build: bool):
+def run_generation(openapi: str, mapping: str, output: str, package_name: str, sdk_version: str, java_version: str, schema_extraction: bool, okhttp_version: str, jackson_version: str, no_build: bool, parse_cache_dir: str = None, pretty: bool = False):
     """Contains the actual generation logic."""
-    print("DEBUG: Entered run_generation function")
+    log.debug("Entered run_generation function")
     
     click.echo("Starting connector generation...")
-    click.echo(f"  OpenAPI Spec: {openapi}")
-    click.echo(f"  Mapping Spec: {mapping}")
-    click.echo(f"  Output Dir:   {output}")
-    click.echo(f"  Package Name: {package_name}")
-    click.echo(f"  SDK Version:  {sdk_version}")
-    click.echo(f"  Java Version: {java_version}")
-    click.echo(f"  Schema Extraction Enabled: {schema_extraction}")
-    click.echo(f"  OkHttp Version: {okhttp_version}")
-    click.echo(f"  Jackson Version: {jackson_version}")
+    # Settings go to the log (shown by the CLI) so library callers don't get them on stdout
+    log.info(
+        "Generation settings: openapi=%s mapping=%s output=%s package_name=%s sdk_version=%s "
+        "java_version=%s schema_extraction=%s okhttp_version=%s jackson_version=%s",
+        openapi, mapping, output, package_name, sdk_version,
+        java_version, schema_extraction, okhttp_version, jackson_version
+    )
 
     # 1. Load and Parse Inputs
     click.echo("Loading specifications...")
-    openapi_spec = load_openapi_spec(openapi)
-    mapping_spec = load_mapping_spec(mapping)
+    openapi_spec = load_openapi_spec(openapi, parse_cache_dir)
+    mapping_spec = load_mapping_spec(mapping, parse_cache_dir)
     click.echo("Specifications loaded successfully.")
 
     # 2. Prepare Output Directory
@@ -50,7 +51,7 @@ def run_generation(openapi: str, mapping: str, output: str, package_name: str, s
         # Consider adding an overwrite confirmation/option here
 
     # 3. Initialize Generator Engine
-    print("DEBUG: About to init GeneratorEngine")
+    log.debug("About to init GeneratorEngine")
     engine = GeneratorEngine(
         openapi_spec,
         mapping_spec,
@@ -60,14 +61,21 @@ def run_generation(openapi: str, mapping: str, output: str, package_name: str, s
         java_version,
         schema_extraction,
         okhttp_version,
-        jackson_version
+        jackson_version,
+        pretty_json=pretty
     )
-    print("DEBUG: GeneratorEngine initialized")
+    log.debug("GeneratorEngine initialized")
 
     # 4. Run Generation Process
-    print("DEBUG: About to call engine.generate_all()")
-    engine.generate_all()
-    print("DEBUG: Returned from engine.generate_all()")
+    log.debug("About to call engine.generate_all()")
+    try:
+        engine.generate_all()
+    except Exception as e:
+        # The engine raises on render/write failures; turn them into a non-zero exit here
+        click.echo(f"ERROR: Connector generation failed: {e}", err=True)
+        traceback.print_exc()
+        sys.exit(1)
+    log.debug("Returned from engine.generate_all()")
 
     click.echo("Connector generation finished successfully!")
     click.echo(f"Generated project located at: {os.path.abspath(output)}")
@@ -81,10 +89,51 @@ def run_generation(openapi: str, mapping: str, output: str, package_name: str, s
     else:
         click.echo("Skipping Maven build step as requested by --no-build flag.")
 
+def run_batch(manifest: str, results_file: str, package_name: str, sdk_version: str, java_version: str, schema_extraction: bool, okhttp_version: str, jackson_version: str, no_build: bool, parse_cache_dir: str = None, fail_fast: bool = False, pretty: bool = False) -> list:
+    """Runs the generation for every {openapi, mapping, output} entry of a manifest file in this process.
+
+    Entries share the loaded modules, template environment and parsed inputs, which saves
+    the interpreter startup a separate invocation per entry would pay. A failing entry does
+    not stop the batch unless fail_fast is set, in which case the entries after it are not run
+    and get no result. Per-entry results are returned and, if results_file is set, written there.
+    """
+    entries = read_json(manifest)
+
+    results = []
+    for entry in entries:
+        output = entry.get('output') if isinstance(entry, dict) else None
+        click.echo(f"=== Batch entry: {output} ===")
+        missing = [key for key in ('openapi', 'mapping', 'output') if not isinstance(entry, dict) or not entry.get(key)]
+        if missing:
+            # A malformed entry fails on its own; the rest of the batch still runs (unless fail_fast)
+            error = f"Manifest entry is missing {', '.join(missing)}"
+            click.echo(f"ERROR: {error}", err=True)
+        else:
+            error = None
+            try:
+                run_generation(
+                    entry['openapi'], entry['mapping'], output, package_name, sdk_version,
+                    java_version, schema_extraction, okhttp_version, jackson_version, no_build, parse_cache_dir, pretty
+                )
+            except SystemExit as e: # run_generation exits non-zero when the engine fails
+                if e.code not in (None, 0):
+                    error = f"Generation exited with code {e.code}"
+            except Exception as e:
+                traceback.print_exc()
+                error = str(e)
+        results.append({'output': output, 'ok': error is None, 'error': error})
+        if fail_fast and error is not None:
+            click.echo(f"Stopping batch after failed entry ({len(entries) - len(results)} not run).", err=True)
+            break
+
+    if results_file:
+        write_json(results_file, results, indent=True)
+    return results
+
 # --- Click Command Wrapper ---
 @click.command()
-@click.option('--openapi', '-o', required=True, type=click.Path(exists=True, dir_okay=False), help='Path to the OpenAPI specification file (JSON).')
-@click.option('--mapping', '-m', required=True, type=click.Path(exists=True, dir_okay=False), help='Path to the mapping specification file (JSON).')
+@click.option('--openapi', '-o', type=click.Path(exists=True, dir_okay=False), help='Path to the OpenAPI specification file (JSON).')
+@click.option('--mapping', '-m', type=click.Path(exists=True, dir_okay=False), help='Path to the mapping specification file (JSON).')
 @click.option('--output', '-out', default='./generated_connector', type=click.Path(file_okay=False), help='Output directory for the generated connector project.')
 @click.option('--package-name', '-p', default='com.example.generated.connector', help='Java package name for the generated code.')
 @click.option('--sdk-version', '-sv', default='8.1.0', help='Target IDDM SDK version (e.g., 8.1.0).')
@@ -93,13 +142,34 @@ def run_generation(openapi: str, mapping: str, output: str, package_name: str, s
 @click.option('--okhttp-version', '-okv', default='4.12.0', help='OkHttp version to use.')
 @click.option('--jackson-version', '-jsv', default='2.17.0', help='Jackson version to use.')
 @click.option('--no-build', is_flag=True, default=False, help='Skip the Maven build step after generation.')
-def generate_command(openapi: str, mapping: str, output: str, package_name: str, sdk_version: str, java_version: str, schema_extraction: bool, okhttp_version: str, jackson_version: str, no_build: bool):
+@click.option('--verbose', '-v', is_flag=True, default=False, help='Enable debug logging.')
+@click.option('--batch-manifest', type=click.Path(exists=True, dir_okay=False), help='JSON list of {openapi, mapping, output} entries to generate in one run (replaces --openapi/--mapping/--output).')
+@click.option('--batch-results', type=click.Path(dir_okay=False), help='Where to write per-entry batch results as JSON.')
+@click.option('--parse-cache-dir', type=click.Path(file_okay=False), help='Directory for caching parsed and validated input files between runs.')
+@click.option('--pretty', is_flag=True, default=False, help='Write JSON resources (mapping_config.json) indented instead of compact.')
+@click.option('--fail-fast', is_flag=True, default=False, help='With --batch-manifest, stop at the first failing entry.')
+def generate_command(openapi: str, mapping: str, output: str, package_name: str, sdk_version: str, java_version: str, schema_extraction: bool, okhttp_version: str, jackson_version: str, no_build: bool, verbose: bool, batch_manifest: str, batch_results: str, parse_cache_dir: str, fail_fast: bool, pretty: bool):
     """Generates an IDDM Data Connector from an OpenAPI spec and a mapping file."""
-    print("DEBUG: Entered generate_command (click wrapper)") # NEW DEBUG
+    if verbose:
+        logging.basicConfig(level=logging.DEBUG, format='%(levelname)s %(name)s: %(message)s')
+    else:
+        # Progress and settings messages are shown plainly; --verbose adds debug output
+        logging.basicConfig(level=logging.INFO, format='%(message)s')
+    log.debug("Entered generate_command (click wrapper)")
+    if batch_manifest:
+        results = run_batch(
+            batch_manifest, batch_results, package_name, sdk_version, java_version,
+            schema_extraction, okhttp_version, jackson_version, no_build, parse_cache_dir, fail_fast, pretty
+        )
+        if not all(r['ok'] for r in results):
+            sys.exit(1)
+        return
+    if not openapi or not mapping:
+        raise click.UsageError("--openapi and --mapping are required unless --batch-manifest is given.")
     # Call the core logic function
     run_generation(
         openapi, mapping, output, package_name, sdk_version, java_version,
-        schema_extraction, okhttp_version, jackson_version, no_build
+        schema_extraction, okhttp_version, jackson_version, no_build, parse_cache_dir, pretty
     )
 
 # --- Script Execution Entry Point ---
@@ -0,0 +1,40 @@
+import json
+from typing import Any, BinaryIO
+
+# orjson (optional) parses and serializes several times faster than the stdlib json module.
+# Its JSONDecodeError subclasses json.JSONDecodeError (and so ValueError), so callers'
+# handlers for the stdlib error cover both.
+try:
+    import orjson
+
+    def load_json(f: BinaryIO) -> Any:
+        """Parses JSON from a file opened in binary mode."""
+        return orjson.loads(f.read())
+
+    def dumps_compact(obj: Any) -> str:
+        """Compact, non-ASCII-escaped JSON text."""
+        return orjson.dumps(obj).decode('utf-8')
+
+    def write_json(path: str, obj: Any, indent: bool = False, sort_keys: bool = False) -> None:
+        """Writes obj to path as JSON, optionally indented by two spaces and with sorted keys."""
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=option))
+except ImportError:
+    def load_json(f: BinaryIO) -> Any:
+        """Parses JSON from a file opened in binary mode."""
+        return json.load(f)
+
+    def dumps_compact(obj: Any) -> str:
+        """Compact, non-ASCII-escaped JSON text."""
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+    def write_json(path: str, obj: Any, indent: bool = False, sort_keys: bool = False) -> None:
+        """Writes obj to path as JSON, optionally indented by two spaces and with sorted keys."""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys, ensure_ascii=False))
+
+def read_json(path: str) -> Any:
+    """Parses the JSON file at path."""
+    with open(path, 'rb') as f:
+        return load_json(f)
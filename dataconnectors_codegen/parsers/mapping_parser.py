@@ -1,6 +1,12 @@
+from typing import Any, Dict, Optional, Tuple
 import json
+import os
 # from jsonschema import validate # For future validation
-from jsonschema import validate, ValidationError
+from jsonschema import Draft7Validator, ValidationError
+from jsonschema.exceptions import best_match
+
+from parsers.json_io import load_json
+from parsers.parse_cache import load_parsed, store_parsed
 
 # Schema definition for the mapping file
 MAPPING_SCHEMA = {
@@ -51,7 +57,8 @@ MAPPING_SCHEMA = {
                                 "apiQueryParam": {"type": "string"} # For mapping LDAP filter attribute to API query param
                             },
                             "required": ["ldapName"],
-                            "oneOf": [
+                            # anyOf stops at the first match; if both are given, prepare_schema_context prefers jsonPath
+                            "anyOf": [
                                 {"required": ["openApiPropertyName"]},
                                 {"required": ["jsonPath"]}
                             ]
@@ -59,7 +66,8 @@ MAPPING_SCHEMA = {
                     }
                 },
                 "required": ["ldapName", "attributes"],
-                 "oneOf": [
+                 # anyOf rather than oneOf: when both are given, openApiSchemaRef wins in prepare_schema_context
+                 "anyOf": [
                     {"required": ["openApiSchemaRef"]},
                     {"required": ["openApiSchemaName"]}
                  ]
@@ -69,6 +77,9 @@ MAPPING_SCHEMA = {
     "required": ["dnStructure", "objectClasses"]
 }
 
+# Built once; the schema is constant, so there is no need to re-check and rebuild it per load
+_MAPPING_VALIDATOR = Draft7Validator(MAPPING_SCHEMA)
+
 class MappingSpec:
     """Represents the parsed Mapping specification."""
     def __init__(self, mapping_data):
@@ -93,24 +104,46 @@ class MappingSpec:
         """Returns the defined DN structure mapping."""
         return self.data.get('dnStructure')
 
-def load_mapping_spec(filepath: str) -> MappingSpec:
+# Parsed mapping files by real path, reused while the file's mtime and size are unchanged
+_MAPPING_CACHE: Dict[str, Tuple[Tuple[int, int], MappingSpec]] = {}
+
+def load_mapping_spec(filepath: str, cache_dir: Optional[str] = None) -> MappingSpec:
     """Loads, validates, and parses the Mapping specification from a JSON file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            mapping_data = json.load(f)
+        with open(filepath, 'rb') as f:
+            st = os.fstat(f.fileno())
+            real_path = os.path.realpath(filepath)
+            file_sig = (st.st_mtime_ns, st.st_size)
+            cached = _MAPPING_CACHE.get(real_path)
+            if cached is not None and cached[0] == file_sig:
+                return cached[1]
+            # Data in the on-disk cache was validated before it was stored
+            mapping_data = load_parsed(cache_dir, 'mapping', real_path, file_sig) if cache_dir else None
+            if mapping_data is not None:
+                mapping = MappingSpec(mapping_data)
+                _MAPPING_CACHE[real_path] = (file_sig, mapping)
+                return mapping
+            mapping_data = load_json(f)
 
         # TODO: Add validation against the defined Mapping schema using jsonschema
         # mapping_schema = { ... } # Define the expected schema
         # validate(instance=mapping_data, schema=mapping_schema)
         try:
-            validate(instance=mapping_data, schema=MAPPING_SCHEMA)
+            # Same error selection as jsonschema.validate(), minus the per-call validator setup
+            error = best_match(_MAPPING_VALIDATOR.iter_errors(mapping_data))
+            if error is not None:
+                raise error
             print("Mapping file validation passed.")
         except ValidationError as e:
             print(f"Error: Mapping file format validation failed for {filepath}:")
             print(f"  - {e.message} (Path: {'/'.join(map(str, e.path)) or 'root'})")
             raise ValueError(f"Invalid mapping file format: {e.message}") from e
 
-        return MappingSpec(mapping_data)
+        if cache_dir:
+            store_parsed(cache_dir, 'mapping', real_path, file_sig, mapping_data)
+        mapping = MappingSpec(mapping_data)
+        _MAPPING_CACHE[real_path] = (file_sig, mapping)
+        return mapping
     except FileNotFoundError:
         print(f"Error: Mapping file not found at {filepath}")
         raise
@@ -1,6 +1,12 @@
+from typing import Any, Dict, Optional, Tuple
 import json
+import os
 # from jsonschema import validate # For future validation
-from jsonschema import validate, ValidationError
+from jsonschema import Draft7Validator, ValidationError
+from jsonschema.exceptions import best_match
+
+from parsers.json_io import load_json
+from parsers.parse_cache import load_parsed, store_parsed
 
 # Basic schema to check for essential top-level OpenAPI keys
 # We check for either 'openapi' (v3) or 'swagger' (v2)
@@ -24,10 +30,15 @@ OPENAPI_BASIC_SCHEMA = {
     ]
 }
 
+# Compiled once at import rather than on every load_openapi_spec() call
+_OPENAPI_VALIDATOR = Draft7Validator(OPENAPI_BASIC_SCHEMA)
+
 class OpenAPISpec:
     """Represents the parsed OpenAPI specification."""
     def __init__(self, spec_data):
         self.data = spec_data
+        # The info block is read by several generators; resolve it once
+        self.info = spec_data.get('info', {})
         # TODO: Add helper methods to easily access parts of the spec
         # e.g., get_servers(), get_security_schemes(), get_paths(), get_schemas()
 
@@ -54,17 +65,35 @@ class OpenAPISpec:
         return {}
 
 
-def load_openapi_spec(filepath: str) -> OpenAPISpec:
+# Parsed specs by real path, reused while the file's mtime and size are unchanged
+_SPEC_CACHE: Dict[str, Tuple[Tuple[int, int], OpenAPISpec]] = {}
+
+def load_openapi_spec(filepath: str, cache_dir: Optional[str] = None) -> OpenAPISpec:
     """Loads, validates (basic structure), and parses the OpenAPI specification from a JSON file."""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            spec_data = json.load(f)
+        with open(filepath, 'rb') as f:
+            st = os.fstat(f.fileno())
+            real_path = os.path.realpath(filepath)
+            file_sig = (st.st_mtime_ns, st.st_size)
+            cached = _SPEC_CACHE.get(real_path)
+            if cached is not None and cached[0] == file_sig:
+                return cached[1]
+            # Data in the on-disk cache was validated before it was stored
+            spec_data = load_parsed(cache_dir, 'openapi', real_path, file_sig) if cache_dir else None
+            if spec_data is not None:
+                spec = OpenAPISpec(spec_data)
+                _SPEC_CACHE[real_path] = (file_sig, spec)
+                return spec
+            spec_data = load_json(f)
 
         # TODO: Add validation against OpenAPI schema using jsonschema
         # schema_url = "..." # URL or path to the OpenAPI schema definition
         # validate(instance=spec_data, schema=...)
         try:
-            validate(instance=spec_data, schema=OPENAPI_BASIC_SCHEMA)
+            # best_match picks the same error jsonschema.validate() would report
+            error = best_match(_OPENAPI_VALIDATOR.iter_errors(spec_data))
+            if error is not None:
+                raise error
             print("Basic OpenAPI structure validation passed.")
         except ValidationError as e:
             print(f"Error: OpenAPI file format validation failed for {filepath}:")
@@ -72,7 +101,11 @@ def load_openapi_spec(filepath: str) -> OpenAPISpec:
             # Optionally print more details from e
             raise ValueError(f"Invalid OpenAPI file format: {e.message}") from e
 
-        return OpenAPISpec(spec_data)
+        if cache_dir:
+            store_parsed(cache_dir, 'openapi', real_path, file_sig, spec_data)
+        spec = OpenAPISpec(spec_data)
+        _SPEC_CACHE[real_path] = (file_sig, spec)
+        return spec
     except FileNotFoundError:
         print(f"Error: OpenAPI file not found at {filepath}")
         raise
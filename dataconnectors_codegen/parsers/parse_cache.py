@@ -0,0 +1,38 @@
+import hashlib
+import os
+from typing import Any, Optional, Tuple
+
+from parsers.json_io import read_json, write_json
+
+# Bump when the stored payload changes shape, so older entries are simply not found
+PARSE_CACHE_VERSION = 2
+
+# Entries are plain JSON rather than pickles: the cache directory is user-supplied, and loading
+# a file someone else planted there must not be able to run code in the generator.
+
+def _entry_path(cache_dir: str, kind: str, real_path: str, file_sig: Tuple[int, int]) -> str:
+    """Cache file for one (kind, path, mtime_ns, size) combination."""
+    key = f"{PARSE_CACHE_VERSION}\0{kind}\0{real_path}\0{file_sig[0]}\0{file_sig[1]}"
+    return os.path.join(cache_dir, hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest() + '.json')
+
+def load_parsed(cache_dir: str, kind: str, real_path: str, file_sig: Tuple[int, int]) -> Optional[Any]:
+    """Returns previously stored parsed data for the file, or None if there is no usable entry."""
+    try:
+        return read_json(_entry_path(cache_dir, kind, real_path, file_sig))
+    except (OSError, ValueError):
+        return None # Missing, truncated or unreadable entry; the caller just parses the file again
+
+def store_parsed(cache_dir: str, kind: str, real_path: str, file_sig: Tuple[int, int], data: Any) -> None:
+    """Stores parsed (and already validated) data for the file. Failures are ignored."""
+    path = _entry_path(cache_dir, kind, real_path, file_sig)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        write_json(tmp_path, data)
+        # Rename into place so concurrent generator runs never read a partial entry
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
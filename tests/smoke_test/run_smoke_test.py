@@ -1,8 +1,18 @@
 import subprocess
+import argparse
+import fnmatch
+import hashlib
+import io
 import json
+import logging
 import os
 import shutil
 import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # --- Configuration ---
 TEST_CASES_FILE = "./tests/smoke_test/test_cases.json"
@@ -10,127 +20,405 @@ PACKAGE_DIR = "dataconnectors_codegen"
 # Module path for -m execution - points to the package
 GENERATOR_MODULE_PATH = "dataconnectors_codegen"
 BASE_OUTPUT_DIR = "./tests/smoke_test/generated_connectors"
+# Parsed-input cache shared by the generator runs; kept across smoke runs (only BASE_OUTPUT_DIR is wiped)
+PARSE_CACHE_DIR = "./tests/smoke_test/.cache"
+# case_id -> hash of the case's inputs and the generator sources, from the last passing run
+CASE_MANIFEST_FILE = "./tests/smoke_test/.manifest.json"
+# Changes to any of these (besides a case's own inputs) affect every case in --changed-only mode
+GENERATOR_DEPENDENCY_PATTERNS = ("dataconnectors_codegen/*", "tests/smoke_test/test_cases.json", "tests/smoke_test/run_smoke_test.py")
 PYTHON_EXECUTABLE = sys.executable 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 PACKAGE_ROOT_DIR = os.path.join(PROJECT_ROOT, "dataconnectors_codegen") # Path to the package itself
+INPUT_KEYS = ("openapi", "mapping")
 # ---
 
-def run_smoke_tests():
-    """Reads test cases and runs the generator for each."""
-    print("--- Starting Smoke Tests ---")
+# JSON file helpers shared with the generator (orjson when installed, the stdlib otherwise)
+sys.path.insert(0, PROJECT_ROOT)
+from dataconnectors_codegen.parsers.json_io import read_json, write_json
+# The same source signature the generator uses to invalidate its skipped renders
+from dataconnectors_codegen.generator.source_signature import source_signature
 
-    # Check existence based on __main__.py within the package
-    generator_entry_point_check = os.path.join(PROJECT_ROOT, PACKAGE_DIR, '__main__.py')
-    if not os.path.exists(generator_entry_point_check):
-        print(f"ERROR: Generator entry point not found at {generator_entry_point_check}")
-        print(f"Hint: Ensure {PACKAGE_DIR}/__main__.py exists.")
-        return False
+# Debug details (e.g. the generator command lines) are only formatted and shown with SMOKE_LOG=DEBUG
+log = logging.getLogger('smoke')
 
-    test_cases_abs_path = os.path.join(PROJECT_ROOT, TEST_CASES_FILE)
-    if not os.path.exists(test_cases_abs_path):
-        print(f"ERROR: Test cases file not found at {test_cases_abs_path}")
-        return False
+def _scan_input_files(case_inputs):
+    """Lists each directory holding test inputs once; returns the normalized absolute paths of the files found."""
+    input_dirs = {
+        os.path.dirname(path)
+        for _, input_paths in case_inputs
+        for path in input_paths.values() if path
+    }
+    present = set()
+    for input_dir in input_dirs:
+        try:
+            with os.scandir(input_dir) as entries:
+                present.update(os.path.join(input_dir, e.name) for e in entries if e.is_file())
+        except OSError:
+            pass # Missing directory: every case reading from it reports its input as not found
+    return present
+
+def _input_paths(case):
+    """Normalized absolute path of each of the case's input files (None where the case names none)."""
+    return {key: os.path.normpath(os.path.join(PROJECT_ROOT, case[key])) if case.get(key) else None for key in INPUT_KEYS}
 
+def _case_hash(case, input_paths, generator_signature):
+    """Hash of everything a case's output depends on: inputs, extra_args and the generator itself."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(generator_signature.encode('utf-8'))
+    for key in INPUT_KEYS:
+        with open(input_paths[key], 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                h.update(chunk)
+    h.update(json.dumps(case.get("extra_args", [])).encode('utf-8'))
+    return h.hexdigest()
+
+def _changed_files(base):
+    """Project-relative paths that differ between base and the working tree, or None if git can't tell."""
     try:
-        with open(test_cases_abs_path, 'r') as f:
-            test_cases = json.load(f)
-    except Exception as e:
-        print(f"ERROR: Failed to load test cases from {test_cases_abs_path}: {e}")
-        return False
+        output = subprocess.check_output(['git', 'diff', '--name-only', base],
+                                         cwd=PROJECT_ROOT, text=True, stderr=subprocess.PIPE)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"WARNING: Could not diff against '{base}' ({e}); running all cases.")
+        return None
+    return set(output.splitlines())
 
-    base_output_abs_path = os.path.join(PROJECT_ROOT, BASE_OUTPUT_DIR)
-    # Ensure base output directory exists and is clean
-    if os.path.exists(base_output_abs_path):
-        print(f"Cleaning existing output directory: {base_output_abs_path}")
-        shutil.rmtree(base_output_abs_path)
-    os.makedirs(base_output_abs_path)
-    print(f"Created base output directory: {base_output_abs_path}")
+def _case_affected(case, changed_files):
+    """Whether the diff touches the case's inputs or the generator code it runs."""
+    inputs = {os.path.normpath(p) for p in (case.get("openapi"), case.get("mapping")) if p}
+    return any(
+        path in inputs or any(fnmatch.fnmatch(path, pattern) for pattern in GENERATOR_DEPENDENCY_PATTERNS)
+        for path in changed_files
+    )
 
-    all_passed = True
-    for case in test_cases:
+def _load_case_manifest(path):
+    try:
+        return read_json(path)
+    except (OSError, ValueError): # orjson.JSONDecodeError is a ValueError too
+        return {}
+
+def _write_case_manifest(path, manifest):
+    """Rewrites the manifest atomically, so an interrupted run never leaves it half written."""
+    tmp_path = f"{path}.tmp"
+    write_json(tmp_path, manifest, indent=True, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def _discard_dir(path):
+    """Moves path out of the way and deletes it on a background thread, which the caller must join.
+       The unlinks then overlap with the generator runs instead of delaying the first one."""
+    trash = f"{path}.trash-{os.getpid()}-{time.time_ns()}"
+    os.replace(path, trash)
+    deleter = threading.Thread(target=shutil.rmtree, args=(trash,), kwargs={'ignore_errors': True})
+    deleter.start()
+    return deleter
+
+def _clear_case_output(output_dir):
+    """Removes a case's previous output before it is regenerated. The generator only adds and
+       overwrites files, so anything a changed input no longer produces would otherwise survive.
+       Returns the deleter thread to join, or None."""
+    if os.path.islink(output_dir):
+        os.remove(output_dir) # Output shared from another case by an earlier run
+    elif os.path.isdir(output_dir):
+        return _discard_dir(output_dir)
+    return None
+
+def _share_output(source_dir, target_dir):
+    """Points target_dir at the output already generated in source_dir: a relative symlink,
+       or a copy where symlinks aren't available (e.g. Windows without developer mode)."""
+    if os.path.islink(target_dir):
+        os.remove(target_dir)
+    elif os.path.isdir(target_dir):
+        shutil.rmtree(target_dir) # Output of an earlier run that generated this case itself
+    try:
+        os.symlink(os.path.relpath(source_dir, os.path.dirname(target_dir)), target_dir, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        shutil.copytree(source_dir, target_dir)
+
+def _pump(stream, buf):
+    """Copies a subprocess pipe into buf in chunks until EOF."""
+    with stream:
+        for chunk in iter(lambda: stream.read1(1 << 16), b''):
+            buf.write(chunk)
+
+def _report_cancelled(case_ids, out):
+    for case_id in case_ids:
+        print(f"\n--- Test Case: {case_id} --- CANCELLED (--fail-fast)", file=out)
+
+def _run_group(cases, extra_args, present_files, stop=None):
+    """Runs the generator once, in batch mode, for test cases sharing the same extra_args.
+       cases holds (case, _input_paths(case)) pairs. Returns (passed, report text, ids of the cases that succeeded).
+       With a stop event (--fail-fast), the group's remaining cases are cancelled after its first failure,
+       and once stop is set (another group failed) the group does not start or its generator is terminated."""
+    out = io.StringIO()
+    passed = True
+    succeeded = []
+    if stop is not None and stop.is_set():
+        _report_cancelled((case.get("case_id", "unknown_case") for case, _ in cases), out)
+        return passed, out.getvalue(), succeeded
+    batch = [] # (case_id, output_dir_rel) of the cases handed to the generator
+    # Cases in a group share extra_args, so cases reading the same two input files produce the same
+    # output: only the first of them is generated, the others get its output
+    batch_case_by_inputs = {}
+    duplicates = [] # (case_id, output_dir_rel, case_id of the generated case with the same inputs)
+
+    for case, input_paths in cases:
         case_id = case.get("case_id", "unknown_case")
         description = case.get("description", "No description")
         # Keep paths relative for the command-line args, check absolute below
         openapi_path_rel = case.get("openapi") # e.g., "./tests/smoke_test/inputs/minimal_openapi.json"
         mapping_path_rel = case.get("mapping") # e.g., "./tests/smoke_test/inputs/minimal_mapping.json"
-        extra_args = case.get("extra_args", [])
         output_dir_rel = os.path.join(BASE_OUTPUT_DIR, case_id) # Relative path for output arg
 
-        print(f"\n--- Running Test Case: {case_id} ---")
-        print(f"Description: {description}")
+        print(f"\n--- Test Case: {case_id} ---", file=out)
+        print(f"Description: {description}", file=out)
 
         if not openapi_path_rel or not mapping_path_rel:
-            print("ERROR: Test case missing 'openapi' or 'mapping' path.")
-            all_passed = False
+            print("ERROR: Test case missing 'openapi' or 'mapping' path.", file=out)
+            passed = False
             continue
 
         # Check existence using paths relative to project root
-        openapi_path_abs = os.path.join(PROJECT_ROOT, openapi_path_rel)
-        mapping_path_abs = os.path.join(PROJECT_ROOT, mapping_path_rel)
+        openapi_path_abs = input_paths["openapi"]
+        mapping_path_abs = input_paths["mapping"]
 
-        if not os.path.exists(openapi_path_abs):
-            print(f"ERROR: OpenAPI input file not found at resolved path: {openapi_path_abs}")
-            all_passed = False
+        if openapi_path_abs not in present_files:
+            print(f"ERROR: OpenAPI input file not found at resolved path: {openapi_path_abs}", file=out)
+            passed = False
             continue
 
-        if not os.path.exists(mapping_path_abs):
-             print(f"ERROR: Mapping input file not found at resolved path: {mapping_path_abs}")
-             all_passed = False
+        if mapping_path_abs not in present_files:
+             print(f"ERROR: Mapping input file not found at resolved path: {mapping_path_abs}", file=out)
+             passed = False
              continue
 
-        # Construct command to execute main.py directly
-        command = [PYTHON_EXECUTABLE, os.path.join(PACKAGE_ROOT_DIR), 
-                   '--openapi', openapi_path_rel,
-                   '--mapping', mapping_path_rel,
-                   '--output', output_dir_rel,
-                   '--no-build'] + extra_args
+        inputs_key = (os.path.realpath(openapi_path_abs), os.path.realpath(mapping_path_abs))
+        if inputs_key in batch_case_by_inputs:
+            duplicates.append((case_id, output_dir_rel, batch_case_by_inputs[inputs_key]))
+            continue
+        batch_case_by_inputs[inputs_key] = case_id
+        batch.append((case_id, {'openapi': openapi_path_rel, 'mapping': mapping_path_rel, 'output': output_dir_rel}))
+
+    if stop is not None and not passed:
+        _report_cancelled([case_id for case_id, _ in batch] + [case_id for case_id, _, _ in duplicates], out)
+        return passed, out.getvalue(), succeeded
+    if not batch:
+        return passed, out.getvalue(), succeeded
+
+    with tempfile.TemporaryDirectory(prefix="smoke_batch_") as tmp_dir:
+        manifest_path = os.path.join(tmp_dir, "manifest.json")
+        results_path = os.path.join(tmp_dir, "results.json")
+        write_json(manifest_path, [entry for _, entry in batch])
 
-        print(f"Running command: {' '.join(command)}")
+        # One generator process for the whole group; it loops over the manifest in-process
+        command = [PYTHON_EXECUTABLE, PACKAGE_ROOT_DIR,
+                   '--batch-manifest', manifest_path,
+                   '--batch-results', results_path,
+                   '--parse-cache-dir', PARSE_CACHE_DIR,
+                   '--no-build'] + list(extra_args)
+        if stop is not None:
+            command.append('--fail-fast') # The generator stops the batch at its first failing entry
 
-        # Prepare environment: Add the PACKAGE directory to PYTHONPATH
-        run_env = os.environ.copy()
-        pythonpath = run_env.get('PYTHONPATH', '')
-        # Add the directory containing parsers/, generator/ etc. to the path
-        run_env['PYTHONPATH'] = f"{PACKAGE_ROOT_DIR}{os.pathsep}{pythonpath}" 
-        print(f"DEBUG: Setting PYTHONPATH for subprocess to: {run_env['PYTHONPATH']}")
+        print(f"\n--- Running batch: {', '.join(case_id for case_id, _ in batch)} ---", file=out)
+        log.debug("Running command: %s", command)
 
         try:
-            # Run the generator script directly with modified env and CWD=PROJECT_ROOT
-            result = subprocess.run(command,
-                                    capture_output=True,
-                                    text=True,
-                                    check=False,
-                                    env=run_env, 
-                                    cwd=PROJECT_ROOT 
+            # Run the package directory as a script with CWD=PROJECT_ROOT. Python puts that directory first
+            # on sys.path, which is what its top-level 'parsers'/'generator' imports need, so the
+            # inherited environment is passed through unchanged (no PYTHONPATH splice)
+            proc = subprocess.Popen(command,
+                                    stdout=subprocess.PIPE,
+                                    stderr=subprocess.PIPE,
+                                    cwd=PROJECT_ROOT,
+                                    bufsize=1 << 16
                                     )
-            
+            # Both pipes are drained as the generator writes them, so neither can fill up and block it
+            stdout_buf, stderr_buf = io.BytesIO(), io.BytesIO()
+            pumps = [threading.Thread(target=_pump, args=(proc.stdout, stdout_buf)),
+                     threading.Thread(target=_pump, args=(proc.stderr, stderr_buf))]
+            for pump in pumps:
+                pump.start()
+            terminated = False
+            while True:
+                try:
+                    # Without a stop event this simply waits; with one, a failure elsewhere ends the run early
+                    returncode = proc.wait(timeout=None if stop is None else 0.2)
+                    break
+                except subprocess.TimeoutExpired:
+                    if stop.is_set() and not terminated:
+                        proc.terminate()
+                        terminated = True
+            for pump in pumps:
+                pump.join()
+
             # ---- ALWAYS PRINT OUTPUT ----
-            print("--- Subprocess STDOUT: ---")
-            print(result.stdout)
-            print("--- Subprocess STDERR: ---")
-            print(result.stderr)
-            print("-------------------------")
+            print("--- Subprocess STDOUT: ---", file=out)
+            print(stdout_buf.getvalue().decode(errors='replace'), file=out)
+            print("--- Subprocess STDERR: ---", file=out)
+            print(stderr_buf.getvalue().decode(errors='replace'), file=out)
+            print("-------------------------", file=out)
             # ---- END PRINT OUTPUT ----
 
-            output_dir_abs_check = os.path.abspath(output_dir_rel)
+            try:
+                results = read_json(results_path)
+            except (OSError, ValueError):
+                # The generator died before writing results; if we stopped it, its cases were cancelled
+                results = [] if terminated else None
+        except Exception as e:
+            print(f"ERROR: Exception occurred while running batch: {e}", file=out)
+            return False, out.getvalue(), succeeded
+
+    # Under --fail-fast the generator leaves out the entries after a failing one
+    if results is None or len(results) > len(batch) or (len(results) < len(batch) and stop is None):
+        print(f"FAILURE: Batch failed with return code {returncode} and no per-case results.", file=out)
+        return False, out.getvalue(), succeeded
 
-            if result.returncode == 0:
-                print(f"SUCCESS: Test case {case_id} completed.")
-                # print("Output:\n", result.stdout) # Optionally print stdout
-                if not os.path.exists(output_dir_abs_check):
-                     print(f"WARNING: Test case {case_id} succeeded but output directory {output_dir_abs_check} not found!")
-                     # all_passed = False # Consider if this should be a failure
-                elif not os.path.exists(os.path.join(output_dir_abs_check, 'pom.xml')):
-                     print(f"WARNING: Test case {case_id} succeeded but pom.xml not found in {output_dir_abs_check}")
+    for (case_id, entry), case_result in zip(batch, results):
+        output_dir_abs_check = os.path.join(PROJECT_ROOT, entry['output'])
 
-            else:
-                print(f"FAILURE: Test case {case_id} failed with return code {result.returncode}.")
-                # Stderr/Stdout are already printed above
-                all_passed = False
+        if case_result.get('ok'):
+            print(f"SUCCESS: Test case {case_id} completed.", file=out)
+            succeeded.append(case_id)
+            if not os.path.exists(output_dir_abs_check):
+                 print(f"WARNING: Test case {case_id} succeeded but output directory {output_dir_abs_check} not found!", file=out)
+                 # passed = False # Consider if this should be a failure
+            elif not os.path.exists(os.path.join(output_dir_abs_check, 'pom.xml')):
+                 print(f"WARNING: Test case {case_id} succeeded but pom.xml not found in {output_dir_abs_check}", file=out)
+        else:
+            print(f"FAILURE: Test case {case_id} failed: {case_result.get('error')}", file=out)
+            # Stderr/Stdout are already printed above
+            passed = False
 
-        except Exception as e:
-            print(f"ERROR: Exception occurred while running test case {case_id}: {e}")
-            all_passed = False
+    _report_cancelled((case_id for case_id, _ in batch[len(results):]), out)
+
+    # Cases with the same inputs as a generated one pass or fail with it
+    outcomes = {case_id: (case_result, entry['output']) for (case_id, entry), case_result in zip(batch, results)}
+    for case_id, output_dir_rel, source_case_id in duplicates:
+        if source_case_id not in outcomes:
+            _report_cancelled((case_id,), out)
+            continue
+        case_result, source_output_rel = outcomes[source_case_id]
+        if not case_result.get('ok'):
+            print(f"FAILURE: Test case {case_id} failed: same inputs as failed case {source_case_id}", file=out)
+            passed = False
+            continue
+        try:
+            _share_output(os.path.join(PROJECT_ROOT, source_output_rel), os.path.join(PROJECT_ROOT, output_dir_rel))
+        except OSError as e:
+            print(f"FAILURE: Test case {case_id} could not reuse the output of {source_case_id}: {e}", file=out)
+            passed = False
+            continue
+        print(f"SUCCESS: Test case {case_id} completed (output shared with {source_case_id}).", file=out)
+        succeeded.append(case_id)
+
+    return passed, out.getvalue(), succeeded
+
+def run_smoke_tests(force=False, changed_only=False, base="main", fail_fast=False):
+    """Reads test cases and runs the generator for each.
+       Cases whose inputs and generator sources are unchanged since their last passing run,
+       and whose output is still present, are skipped unless force is set. With changed_only,
+       cases the diff against base does not touch are skipped as well (again unless force).
+       With fail_fast, groups that have not started yet are cancelled once any group fails."""
+    print("--- Starting Smoke Tests ---")
+
+    # Check existence based on __main__.py within the package
+    generator_entry_point_check = os.path.join(PROJECT_ROOT, PACKAGE_DIR, '__main__.py')
+    if not os.path.exists(generator_entry_point_check):
+        print(f"ERROR: Generator entry point not found at {generator_entry_point_check}")
+        print(f"Hint: Ensure {PACKAGE_DIR}/__main__.py exists.")
+        return False
+
+    test_cases_abs_path = os.path.join(PROJECT_ROOT, TEST_CASES_FILE)
+    if not os.path.exists(test_cases_abs_path):
+        print(f"ERROR: Test cases file not found at {test_cases_abs_path}")
+        return False
+
+    try:
+        test_cases = read_json(test_cases_abs_path)
+    except Exception as e:
+        print(f"ERROR: Failed to load test cases from {test_cases_abs_path}: {e}")
+        return False
+
+    base_output_abs_path = os.path.join(PROJECT_ROOT, BASE_OUTPUT_DIR)
+    manifest_abs_path = os.path.join(PROJECT_ROOT, CASE_MANIFEST_FILE)
+    # A forced run starts from a clean output directory; otherwise the outputs of skipped cases are
+    # kept and only the cases that run again have theirs cleared
+    deleters = []
+    if force and os.path.exists(base_output_abs_path):
+        print(f"Cleaning existing output directory: {base_output_abs_path}")
+        deleters.append(_discard_dir(base_output_abs_path))
+    if not os.path.exists(base_output_abs_path):
+        os.makedirs(base_output_abs_path)
+        print(f"Created base output directory: {base_output_abs_path}")
+    manifest = {} if force else _load_case_manifest(manifest_abs_path)
+
+    all_passed = True
+    if not test_cases:
+        print("WARNING: No test cases defined.")
+    else:
+        # Input paths are resolved once per case and reused for the existence checks, hashing and the runs
+        case_inputs = [(case, _input_paths(case)) for case in test_cases]
+        # One directory listing per input directory instead of a stat per input file
+        present_files = _scan_input_files(case_inputs)
+        generator_signature = source_signature()
+        changed_files = _changed_files(base) if changed_only and not force else None
+
+        # Cases that share extra_args go through one batch invocation of the generator
+        groups = defaultdict(list)
+        case_hashes = {}
+        for case, input_paths in case_inputs:
+            case_id = case.get("case_id", "unknown_case")
+            if all(path in present_files for path in input_paths.values()):
+                pom_path = os.path.join(base_output_abs_path, case_id, 'pom.xml')
+                # Only a case whose last run passed (it is in the manifest) may be skipped; a pom.xml alone
+                # may be left over from a failed run
+                if (changed_files is not None and case_id in manifest and not _case_affected(case, changed_files)
+                        and os.path.exists(pom_path)):
+                    print(f"\n--- Test Case: {case_id} --- SKIP (not affected by diff against {base})")
+                    continue
+                case_hashes[case_id] = _case_hash(case, input_paths, generator_signature)
+                if manifest.get(case_id) == case_hashes[case_id] and os.path.exists(pom_path):
+                    print(f"\n--- Test Case: {case_id} --- SKIP (cached)")
+                    continue
+            # Cases with missing inputs still run, so _run_group reports them
+            groups[tuple(case.get("extra_args", []))].append((case, input_paths))
+            case_deleter = _clear_case_output(os.path.join(base_output_abs_path, case_id))
+            if case_deleter is not None:
+                deleters.append(case_deleter)
+
+        # Groups are independent generator subprocesses, so they run side by side; each group's
+        # report is buffered and printed in one piece when it completes
+        all_succeeded = set()
+        max_workers = max(1, min(len(groups), os.cpu_count() or 1))
+        # Under --fail-fast, the first failing group sets stop: running generators are terminated
+        # and groups that have not started yet are cancelled
+        stop = threading.Event() if fail_fast else None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_run_group, cases, extra_args, present_files, stop): cases for extra_args, cases in groups.items()}
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                passed, report, succeeded = future.result()
+                print(report, end='')
+                all_passed &= passed
+                all_succeeded.update(succeeded)
+                if fail_fast and not passed:
+                    stop.set()
+                    for pending in futures:
+                        if pending.cancel():
+                            for case, _ in futures[pending]:
+                                print(f"\n--- Test Case: {case.get('case_id', 'unknown_case')} --- CANCELLED (--fail-fast)")
+
+        for cases in groups.values():
+            for case, _ in cases:
+                case_id = case.get("case_id", "unknown_case")
+                if case_id in all_succeeded:
+                    manifest[case_id] = case_hashes[case_id]
+                else:
+                    manifest.pop(case_id, None) # Failed this time; never skip it next run
+
+        _write_case_manifest(manifest_abs_path, manifest)
+
+    for deleter in deleters:
+        deleter.join() # Don't exit while old output trees are still being deleted
 
     print("\n--- Smoke Tests Finished ---")
     if all_passed:
@@ -141,7 +429,14 @@ def run_smoke_tests():
         return False
 
 if __name__ == "__main__":
-    if run_smoke_tests():
+    parser = argparse.ArgumentParser(description="Runs the generator smoke test cases.")
+    parser.add_argument('--force', '--force-all', action='store_true', help="Re-run every case, ignoring results cached from earlier runs and --changed-only.")
+    parser.add_argument('--changed-only', action='store_true', help="Skip cases whose inputs and generator code are unchanged relative to --base.")
+    parser.add_argument('--base', default="main", help="Git revision --changed-only diffs against (default: main).")
+    parser.add_argument('--fail-fast', action='store_true', help="Cancel the remaining cases, including running ones, once one has failed.")
+    args = parser.parse_args()
+    logging.basicConfig(level=os.environ.get('SMOKE_LOG', 'INFO').upper(), format='%(levelname)s %(name)s: %(message)s')
+    if run_smoke_tests(force=args.force, changed_only=args.changed_only, base=args.base, fail_fast=args.fail_fast):
         sys.exit(0)
     else:
         sys.exit(1)
\ No newline at end of file
@@ -1,9 +1,24 @@
+import asyncio
+import hashlib
+import os
+from importlib.metadata import PackageNotFoundError, version
+
 from llama_parse import LlamaParse
 
+RESULT_TYPE = "markdown"  # "markdown" and "text" are available
+
+# (input PDF, output markdown) pairs; all of them are parsed concurrently
+PDFS_TO_PARSE = [
+    ("./docs/IDDM Connector SDK Public API Design.pdf", "./docs/iddm_connector_sdk_public_api_design.md"),
+]
+
+# Parsed markdown keyed by PDF content and parser settings, so unchanged PDFs are not sent again
+PARSE_CACHE_DIR = "./docs/.parse_cache"
+
 # Initialize the LlamaParse parser
+# The API key is read from the LLAMA_CLOUD_API_KEY environment variable
 parser = LlamaParse(
-    api_key="llx-9o9TqFkuAhuyUUQ98EX2mHzVHCl7GzreMvDfoH4VXwOBBBbm",  # can also be set in your env as LLAMA_CLOUD_API_KEY
-    result_type="markdown",  # "markdown" and "text" are available
+    result_type=RESULT_TYPE,
     verbose=True
 )
 
@@ -16,10 +31,41 @@ It contains many tables.
 Try to be precise while answering the questions.
 """
 
-# Parse the document
-parsed_documents = parser.load_data("./docs/IDDM Connector SDK Public API Design.pdf")
+def _parser_version() -> str:
+    try:
+        return version("llama-parse")
+    except PackageNotFoundError:
+        return "unknown"
+
+def _cache_path(pdf_path: str) -> str:
+    """Cache file for a PDF, keyed by its bytes, the result type and the llama-parse version."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    h.update(f"\0{RESULT_TYPE}\0{_parser_version()}".encode('utf-8'))
+    return os.path.join(PARSE_CACHE_DIR, h.hexdigest() + '.md')
+
+async def _parse_to_markdown(pdf_path: str, output_path: str) -> None:
+    cache_path = _cache_path(pdf_path)
+    if os.path.exists(cache_path):
+        print(f"Using cached parse for {pdf_path}")
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            text = f.read()
+    else:
+        # Parse the document
+        parsed_documents = await parser.aload_data(pdf_path)
+        text = ''.join(doc.text + '\n' for doc in parsed_documents)
+        os.makedirs(PARSE_CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    # Save the parsed results
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+async def main() -> None:
+    await asyncio.gather(*(_parse_to_markdown(pdf, out) for pdf, out in PDFS_TO_PARSE))
 
-# Save the parsed results
-with open('./docs/iddm_connector_sdk_public_api_design.md', 'w') as f:
-    for doc in parsed_documents:
-        f.write(doc.text + '\n')
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(main())